@@ -49,6 +49,9 @@ def main():
     # 初始化设置存储与关闭策略。
     # EN: Initialize settings store and close-policy manager.
     settings_store = SettingsStore()
+    # 任何退出路径（包括系统注销/关机）都写出延迟保存中的设置。
+    # EN: Write out deferred settings on every quit path, including system logoff/shutdown.
+    app.aboutToQuit.connect(settings_store.flush)
 
     # 迁移旧版DeepSeek密钥到新格式
     # EN: Migrate legacy DeepSeek key to new format
@@ -175,6 +178,10 @@ def main():
         if music_player is not None and hasattr(music_player, "dispose") and callable(music_player.dispose):
             music_player.dispose()
 
+        # 写出延迟保存中的设置修改。
+        # EN: Write out settings changes still waiting for their deferred save.
+        settings_store.flush()
+
         app.quit()
 
     def open_main_window():
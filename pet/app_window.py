@@ -325,6 +325,7 @@ class AppWindow(QMainWindow):
             self.music_player.mode_changed.connect(self._on_music_mode_changed)
             self.music_player.duration_changed.connect(self._on_music_duration_changed)
             self.music_player.position_changed.connect(self._on_music_position_changed)
+            self.music_player.tracks_imported.connect(self._on_music_tracks_imported)
 
         self._sync_controls_from_pet()
 
@@ -1762,6 +1763,10 @@ class AppWindow(QMainWindow):
                 self.music_player.position_changed.disconnect(self._on_music_position_changed)
             except Exception:
                 pass
+            try:
+                self.music_player.tracks_imported.disconnect(self._on_music_tracks_imported)
+            except Exception:
+                pass
 
         if hasattr(self.pet, "language_changed"):
             try:
@@ -1974,7 +1979,7 @@ class AppWindow(QMainWindow):
             return
 
         row = self.music_list_widget.row(item)
-        if row < 0 or row >= len(self.music_player.playlist):
+        if row < 0 or row >= self.music_player.track_count:
             return
 
         menu = QMenu(self.music_list_widget)
@@ -1990,10 +1995,10 @@ class AppWindow(QMainWindow):
         """EN: Rename the song in the specified row, and after confirmation, change the music directory file name synchronously."""
         if self.music_player is None:
             return
-        if not (0 <= row < len(self.music_player.playlist)):
+        if not (0 <= row < self.music_player.track_count):
             return
 
-        old_stem = self.music_player.playlist[row].stem
+        old_stem = self.music_player.track_at(row).stem
         new_name, ok = QInputDialog.getText(
             self,
             self._l("重命名歌曲", "Rename Track", "曲名変更", "곡 이름 변경", "Renommer le morceau"),
@@ -2060,15 +2065,13 @@ class AppWindow(QMainWindow):
         if not files:
             return
 
-        success = 0
-        failed_messages = []
-        for path in files:
-            ok, msg = self.music_player.add_track_from_file(path)
-            if ok:
-                success += 1
-            else:
-                failed_messages.append(f"{path}: {msg}")
+        # 复制在后台线程进行，大文件不会阻塞界面；结果由 tracks_imported 回调处理。
+        # EN: Copying runs on a background thread so large files do not block the UI; the result arrives via tracks_imported.
+        self.music_player.import_tracks_async(files)
 
+    def _on_music_tracks_imported(self, success: int, failed_messages: list):
+        """后台导入完成后刷新播放列表并提示失败项。"""
+        """EN: Refresh the playlist after a background import finishes and report failures."""
         self._music_refresh_playlist()
         self._sync_music_ui_from_player()
 
@@ -2225,8 +2228,8 @@ class AppWindow(QMainWindow):
         # EN: Refresh number display
         for i in range(self.music_list_widget.count()):
             item = self.music_list_widget.item(i)
-            if self.music_player and i < len(self.music_player.playlist):
-                item.setText(f"{i + 1}. {self.music_player.playlist[i].stem}")
+            if self.music_player and i < self.music_player.track_count:
+                item.setText(f"{i + 1}. {self.music_player.track_at(i).stem}")
         self._highlight_current_track()
 
     # ---------------------------------------------------------------
@@ -37,6 +37,7 @@ PET_AVATAR_PATH = Path(ROOT_DIR) / "gifs" / "photo.jpg"
 PLAYER_AVATAR_PATH = Path(ROOT_DIR) / "gifs" / "player.png"
 CHAT_BACKGROUND_PATH = Path(ROOT_DIR) / "gifs" / "chat_background.png"
 EMOJI_ASSETS_ROOT = Path(ROOT_DIR) / "gifs" / "assets"
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
 
 
 def _safe_disconnect(signal, slot):
@@ -870,7 +871,7 @@ class ChatPanel(QWidget):
         if not html:
             return paths
 
-        for src in re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', html, flags=re.IGNORECASE):
+        for src in _IMG_SRC_RE.findall(html):
             parsed = urlparse(src)
             if parsed.scheme == "file":
                 local_path = unquote(parsed.path)
@@ -70,3 +70,4 @@ class IdleController:
         """EN: Exit the resting state. Restore the current animation after clearing the marker."""
         self.pet.state.exit_rest()
         self.pet._apply_state_animation()
+        self.pet.movement.wake_ticking()
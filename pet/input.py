@@ -53,6 +53,7 @@ def handle_mouse_release(pet, event) -> bool:
     pet.idle.try_enter_rest()
     if not pet.state.in_rest:
         pet._apply_state_animation()
+        pet.movement.wake_ticking()
 
     event.accept()
     return True
@@ -5,9 +5,10 @@ from __future__ import annotations
 
 import ctypes
 import random
+from collections import defaultdict
 from ctypes import wintypes
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
 from .autostart import is_autostart_enabled
@@ -45,10 +46,57 @@ class RECT(ctypes.Structure):
     ]
 
 
+DESKTOP_WINDOW_CLASSES = frozenset({"Progman", "WorkerW"})
+CLASS_NAME_CACHE_MAX = 64
+# 每经过这么多次显示策略计算清空一次类名缓存，防止句柄被系统复用后读到旧类名。
+# EN: Clear the class-name cache every this many policy passes so recycled handles never serve a stale name.
+CLASS_NAME_CACHE_AGE_PASSES = 256
+
 GWL_STYLE = -16
 WS_CAPTION = 0x00C00000
 WS_THICKFRAME = 0x00040000
 
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MINIMIZEEND = 0x0017
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+# 碰撞检测与显示策略轮询共用一个粗精度计时器，避免系统维持高精度定时。
+# EN: Collision checks and display polling share one coarse timer so Windows need not keep a high timer resolution.
+MANAGER_TICK_MS = 66
+
+# 有事件钩子兜底时，显示策略只需低频轮询；钩子不可用时每个管理器节拍轮询一次。
+# EN: With WinEvent hooks installed the display policy only needs a slow safety poll; without hooks it polls on every manager tick.
+DISPLAY_FALLBACK_INTERVAL_MS = 2000
+# 无钩子轮询时，前台与显示决策都未变化则逐次加倍间隔，上限约 500ms；一旦变化立即回到每拍轮询。
+# EN: Without hooks, the poll interval doubles while neither the foreground window nor the decision changes, capped near 500 ms; any change snaps back to every tick.
+DISPLAY_POLL_MAX_INTERVAL_MS = 500
+DISPLAY_EVENT_COALESCE_MS = 30
+
+WINEVENTPROC = (
+    ctypes.WINFUNCTYPE(
+        None,
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.HWND,
+        wintypes.LONG,
+        wintypes.LONG,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    )
+    if hasattr(ctypes, "WINFUNCTYPE")
+    else None
+)
+
+WNDENUMPROC = (
+    ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    if hasattr(ctypes, "WINFUNCTYPE")
+    else None
+)
+
 
 class MONITORINFO(ctypes.Structure):
     """Windows 显示器信息结构。"""
@@ -62,9 +110,78 @@ class MONITORINFO(ctypes.Structure):
     ]
 
 
+# 显示模式位标记。热路径用整数位测试代替字符串比较。
+# EN: Display-mode bit flags. Hot paths use integer bit tests instead of string comparisons.
+DISPLAY_FLAG_ALWAYS_ON_TOP = 1
+DISPLAY_FLAG_FULLSCREEN_HIDE = 2
+DISPLAY_FLAG_DESKTOP_ONLY = 4
+
+
+# 显示模式与位标记互查表。一次字典查找替代逐个字符串比较，未知模式按置顶处理。
+# EN: Display mode <-> bit flag lookup tables. One dict lookup replaces chained string compares; unknown modes map to always-on-top.
+_DISPLAY_MODE_BIT = {
+    DISPLAY_MODE_ALWAYS_ON_TOP: DISPLAY_FLAG_ALWAYS_ON_TOP,
+    DISPLAY_MODE_FULLSCREEN_HIDE: DISPLAY_FLAG_FULLSCREEN_HIDE,
+    DISPLAY_MODE_DESKTOP_ONLY: DISPLAY_FLAG_DESKTOP_ONLY,
+}
+_DISPLAY_BIT_MODE = {bit: mode for mode, bit in _DISPLAY_MODE_BIT.items()}
+
+
+# 碰撞网格的"前向"邻格。每对相邻格子只检查一次，避免重复配对。
+# EN: "Forward" neighbour cells of the collision grid, so each pair of adjacent cells is checked only once.
+_GRID_FORWARD_NEIGHBORS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+def _frame_box(pet) -> tuple:
+    """读取实例外框并转为 (left, top, right, bottom) 整数元组。right/bottom 为开区间。"""
+    """EN: Read the pet's frame geometry as an (left, top, right, bottom) int tuple. right/bottom are exclusive."""
+    rect = pet.frameGeometry()
+    left = rect.x()
+    top = rect.y()
+    return (left, top, left + rect.width(), top + rect.height())
+
+
+def _aabb_overlap(a: tuple, b: tuple) -> bool:
+    """判断两个 (left, top, right, bottom) 矩形是否相交。"""
+    """EN: Whether two (left, top, right, bottom) boxes intersect."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _aabb_intersect_wh(a: tuple, b: tuple) -> tuple:
+    """返回两个矩形交集的宽高。不相交时为 0。"""
+    """EN: Width and height of the intersection of two boxes; 0 when they do not intersect."""
+    return (
+        max(0, min(a[2], b[2]) - max(a[0], b[0])),
+        max(0, min(a[3], b[3]) - max(a[1], b[1])),
+    )
+
+
+# 桌宠能力表：注册时一次性解析为绑定方法或属性，广播时不再逐次 hasattr 探测。
+# EN: Pet capability table, resolved to bound methods or attributes once at registration so broadcasts skip per-call hasattr probes.
+PET_CAPABILITIES = {
+    "move": "apply_move_enabled",
+    "follow": "apply_follow_enabled",
+    "scale": "apply_scale",
+    "autostart": "apply_autostart",
+    "opacity": "apply_opacity_percent",
+    "language": "apply_language",
+    "always_on_top": "set_always_on_top",
+    "topmost_multi": "set_force_topmost_for_multi",
+    "show": "show",
+    "hide": "hide",
+    "prepare_exit": "prepare_for_exit",
+    "close": "close",
+    "delete_later": "deleteLater",
+    "reset_for_pool": "reset_for_pool",
+    "resume_from_pool": "resume_from_pool",
+    "is_visible": "isVisible",
+    "movement": "movement",
+}
+
+
 class PetInstanceManager(QObject):
-    """多开管理器。对外暴露与桌宠实例兼容的方法和状态。"""
-    """EN: Multi-open the manager. Exposure to methods and states compatible with table pet instances."""
+    """多开管理器。对外暴露与桌宠实例兼容的方法和状态。设置值未变化时不广播、不持久化、不发信号。"""
+    """EN: Multi-open the manager. Exposure to methods and states compatible with table pet instances. Setters that receive the current value skip broadcasting, persisting and signal emission."""
 
     follow_changed = Signal(bool)
     scale_changed = Signal(float)
@@ -87,66 +204,361 @@ class PetInstanceManager(QObject):
         self.state.follow_mouse = self.settings_store.get_follow_mouse()
         self.scale_factor: float = self.settings_store.get_scale_factor()
         self.display_mode: str = self.settings_store.get_display_mode()
+        self._display_mode_flags: int = _DISPLAY_MODE_BIT.get(self.display_mode, DISPLAY_FLAG_ALWAYS_ON_TOP)
         self.target_count: int = self.settings_store.get_instance_count()
         self.opacity_percent: int = self.settings_store.get_opacity_percent()
         self.language: str = self.settings_store.get_language()
+        # 开机自启状态来自注册表，首次读取后缓存，由 on_set_autostart 更新。
+        # EN: Autostart state lives in the registry; it is read lazily once and then kept current by on_set_autostart.
+        self._autostart_cached: bool | None = None
 
         self._pets = []
+        # 只读遍历使用的不可变快照，仅在注册/注销时重建。
+        # EN: Immutable snapshot for read-only iteration, rebuilt only when pets are registered or unregistered.
+        self._pets_tuple: tuple = ()
+        self._pets_set: set = set()
+        # 批量增减实例期间暂缓逐个同步，结束时一次性应用。
+        # EN: Per-pet synchronization is deferred during bulk count changes and applied once at the end.
+        self._suspend_sync = False
+        self._deferred_register: list = []
+        # 已关闭但可复用的实例。容量上限为 INSTANCE_COUNT_MAX。
+        # EN: Closed instances kept for reuse. Capped at INSTANCE_COUNT_MAX.
+        self._pet_pool: list = []
         self._spawn_callback = None
-        self._user32 = getattr(ctypes, "windll", None).user32 if hasattr(ctypes, "windll") else None
-
-        self._display_timer = QTimer(self)
-        self._display_timer.setInterval(50)
-        self._display_timer.timeout.connect(self._apply_display_policy)
-        self._display_timer.start()
+        self._user32 = None
+        self._bind_user32()
+        self._class_name_cache: dict[int, str] = {}
+        self._class_name_cache_tick = 0
+        # 仅在 GUI 线程（定时器/事件钩子）中使用，可安全复用。
+        # EN: Only touched from the GUI thread (timers/WinEvent hooks), so it is safe to reuse.
+        self._class_name_buf = ctypes.create_unicode_buffer(256)
+
+        # 全屏判断复用的 ctypes 缓冲区。GetWindowRect/GetMonitorInfoW 会覆盖全部字段，无需每次清零。
+        # EN: Reusable ctypes buffers for the fullscreen check. GetWindowRect/GetMonitorInfoW overwrite every field, so no re-zeroing is needed.
+        self._rect_buf = RECT()
+        self._rect_ref = ctypes.byref(self._rect_buf)
+        self._monitor_info_buf = MONITORINFO()
+        self._monitor_info_buf.cbSize = ctypes.sizeof(MONITORINFO)
+        self._monitor_info_ref = ctypes.byref(self._monitor_info_buf)
+        # 窗口所在显示器矩形缓存，仅保留当前检测窗口；窗口切换或移动时失效。
+        # EN: Monitor rect cache for the window being checked; dropped when that window changes or moves.
+        self._monitor_rect_for_hwnd: dict[int, tuple[int, int, int, int]] = {}
+
+        # 前台切换/最小化/窗口位置变化由 WinEvent 钩子推送，短时间内的多次事件合并为一次策略计算。
+        # EN: Foreground/minimize/location changes are pushed by WinEvent hooks; bursts are coalesced into one policy pass.
+        self._display_event_timer = QTimer(self)
+        self._display_event_timer.setSingleShot(True)
+        self._display_event_timer.setTimerType(Qt.CoarseTimer)
+        self._display_event_timer.setInterval(DISPLAY_EVENT_COALESCE_MS)
+        self._display_event_timer.timeout.connect(self._apply_display_policy)
+
+        self._win_event_proc = None
+        self._win_event_hooks = []
+        # 窗口位置变化钩子是全局的，系统内任何光标、插入符与窗口移动都会回调。仅全屏隐藏模式需要，单独管理。
+        # EN: The location-change hook is global and fires for every cursor, caret and window move system-wide. Only fullscreen-hide mode needs it, so it is managed separately.
+        self._location_hook = None
+
+        # EnumWindows 回调只创建一次并保持引用。遍历期间的过滤条件与结果放在实例字段上。
+        # EN: The EnumWindows callback is created once and kept referenced; per-walk filter state and the result live on the instance.
+        self._enum_windows_proc = WNDENUMPROC(self._on_enum_window) if self._user32 is not None else None
+        self._enum_pet_handles: set[int] = set()
+        self._enum_result = 0
+
+        # 每隔多少个节拍轮询一次显示策略。0 表示不轮询。
+        # EN: Poll the display policy every this many ticks. 0 disables polling.
+        self._display_poll_ticks = 0
+        self._display_tick_countdown = 0
+        self._last_foreground_hwnd = 0
         self._last_should_show = True
+        self._update_display_polling()
+
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setTimerType(Qt.CoarseTimer)
+        self._tick_timer.setInterval(MANAGER_TICK_MS)
+        self._tick_timer.timeout.connect(self._on_tick)
+        self._tick_timer.start()
+
+    def _bind_user32(self):
+        """加载独立的 user32 句柄，声明函数原型并缓存常用函数指针。"""
+        """EN: Load a private user32 handle, declare function prototypes and cache the frequently used function pointers."""
+        self._GetForegroundWindow = None
+        self._GetWindowRect = None
+        self._MonitorFromWindow = None
+        self._GetMonitorInfoW = None
+        self._IsWindow = None
+        self._IsWindowVisible = None
+        self._IsIconic = None
+        self._GetClassNameW = None
+        self._EnumWindows = None
+        self._GetWindowLongW = None
+        self._IsZoomed = None
+        if not hasattr(ctypes, "WinDLL"):
+            return
+
+        # 使用独立 WinDLL 实例，原型声明不会影响其他模块对 ctypes.windll.user32 的调用。
+        # EN: A private WinDLL instance keeps these prototypes from leaking into other users of ctypes.windll.user32.
+        user32 = ctypes.WinDLL("user32")
+
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        user32.GetForegroundWindow.argtypes = []
+        user32.GetWindowRect.restype = wintypes.BOOL
+        user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(RECT)]
+        user32.MonitorFromWindow.restype = wintypes.HMONITOR
+        user32.MonitorFromWindow.argtypes = [wintypes.HWND, wintypes.DWORD]
+        user32.GetMonitorInfoW.restype = wintypes.BOOL
+        user32.GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(MONITORINFO)]
+        user32.IsWindow.restype = wintypes.BOOL
+        user32.IsWindow.argtypes = [wintypes.HWND]
+        user32.IsWindowVisible.restype = wintypes.BOOL
+        user32.IsWindowVisible.argtypes = [wintypes.HWND]
+        user32.IsIconic.restype = wintypes.BOOL
+        user32.IsIconic.argtypes = [wintypes.HWND]
+        user32.GetClassNameW.restype = ctypes.c_int
+        user32.GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        user32.EnumWindows.restype = wintypes.BOOL
+        user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+        user32.GetWindowLongW.restype = wintypes.LONG
+        user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+        user32.IsZoomed.restype = wintypes.BOOL
+        user32.IsZoomed.argtypes = [wintypes.HWND]
+
+        self._user32 = user32
+        self._GetForegroundWindow = user32.GetForegroundWindow
+        self._GetWindowRect = user32.GetWindowRect
+        self._MonitorFromWindow = user32.MonitorFromWindow
+        self._GetMonitorInfoW = user32.GetMonitorInfoW
+        self._IsWindow = user32.IsWindow
+        self._IsWindowVisible = user32.IsWindowVisible
+        self._IsIconic = user32.IsIconic
+        self._GetClassNameW = user32.GetClassNameW
+        self._EnumWindows = user32.EnumWindows
+        self._GetWindowLongW = user32.GetWindowLongW
+        self._IsZoomed = user32.IsZoomed
+
+    def _update_display_polling(self):
+        """按显示模式启停前台探测。置顶模式始终显示，不安装钩子也不轮询。"""
+        """EN: Start or stop foreground probing by display mode. Always-on-top always shows, so it needs neither hooks nor polling."""
+        if self._display_mode_flags & DISPLAY_FLAG_ALWAYS_ON_TOP:
+            self._remove_win_event_hooks()
+            self._display_event_timer.stop()
+            self._display_poll_ticks = 0
+            return
+
+        if not self._win_event_hooks:
+            self._install_win_event_hooks()
+        self._set_location_hook(bool(self._display_mode_flags & DISPLAY_FLAG_FULLSCREEN_HIDE))
+        if self._win_event_hooks:
+            self._display_poll_ticks = max(1, DISPLAY_FALLBACK_INTERVAL_MS // MANAGER_TICK_MS)
+        else:
+            self._display_poll_ticks = 1
+        self._display_tick_countdown = self._display_poll_ticks
+
+    def _on_tick(self):
+        """管理器节拍。处理碰撞，并按间隔轮询显示策略。两者互不影响。"""
+        """EN: Manager tick. Resolves collisions and polls the display policy at its interval; a failure in one does not skip the other."""
+        try:
+            self._resolve_pet_collisions()
+        except Exception:
+            pass
 
-        self._collision_timer = QTimer(self)
-        self._collision_timer.setInterval(45)
-        self._collision_timer.timeout.connect(self._resolve_pet_collisions)
-        self._collision_timer.start()
+        # 没有实例时无需判断显示策略。
+        # EN: Nothing to show or hide without pets.
+        if not self._display_poll_ticks or not self._pets_tuple:
+            return
+        self._display_tick_countdown -= 1
+        if self._display_tick_countdown > 0:
+            return
+        try:
+            self._apply_display_policy()
+        except Exception:
+            pass
+        self._display_tick_countdown = self._display_poll_ticks
+
+    def _adapt_display_poll(self, should_show: bool):
+        """无钩子轮询时按前台窗口与显示决策是否变化调整轮询间隔（指数退避）。"""
+        """EN: Exponential back-off for hookless polling, driven by whether the foreground window or the decision changed."""
+        if self._win_event_hooks or not self._display_poll_ticks or self._user32 is None:
+            return
+
+        hwnd = self._GetForegroundWindow() or 0
+        if should_show != self._last_should_show or hwnd != self._last_foreground_hwnd:
+            self._display_poll_ticks = 1
+        else:
+            self._display_poll_ticks = min(
+                self._display_poll_ticks * 2,
+                max(1, DISPLAY_POLL_MAX_INTERVAL_MS // MANAGER_TICK_MS),
+            )
+        self._last_foreground_hwnd = hwnd
+
+    def _install_win_event_hooks(self):
+        """注册前台切换/最小化的 WinEvent 钩子。失败时保持轮询模式。"""
+        """EN: Register WinEvent hooks for foreground and minimize changes. Falls back to polling on failure."""
+        if self._user32 is None or WINEVENTPROC is None:
+            return
+
+        try:
+            self._user32.SetWinEventHook.restype = wintypes.HANDLE
+            self._user32.SetWinEventHook.argtypes = [
+                wintypes.DWORD,
+                wintypes.DWORD,
+                wintypes.HMODULE,
+                WINEVENTPROC,
+                wintypes.DWORD,
+                wintypes.DWORD,
+                wintypes.DWORD,
+            ]
+            self._user32.UnhookWinEvent.restype = wintypes.BOOL
+            self._user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+            # 回调对象必须保持引用，否则会在钩子仍生效时被回收。
+            # EN: Keep a reference to the callback; otherwise it is collected while the hook is still active.
+            self._win_event_proc = WINEVENTPROC(self._on_win_event)
+            hook = self._user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND,
+                EVENT_SYSTEM_MINIMIZEEND,
+                None,
+                self._win_event_proc,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT,
+            )
+            if hook:
+                self._win_event_hooks.append(hook)
+        except Exception:
+            self._remove_win_event_hooks()
+
+    def _set_location_hook(self, enabled: bool):
+        """按需注册或注销窗口位置变化钩子。依赖前台钩子已注册（共用同一回调）。"""
+        """EN: Register or unregister the window location-change hook on demand. Relies on the foreground hooks being registered, since it shares their callback."""
+        if not enabled:
+            hook = self._location_hook
+            self._location_hook = None
+            if hook:
+                try:
+                    self._user32.UnhookWinEvent(hook)
+                except Exception:
+                    pass
+            return
+
+        if self._location_hook or not self._win_event_hooks or self._win_event_proc is None:
+            return
+        # 钩子未注册期间窗口可能已移动，先丢弃显示器矩形缓存。
+        # EN: Windows may have moved while the hook was off, so drop the monitor rect cache first.
+        self._monitor_rect_for_hwnd.clear()
+        try:
+            self._location_hook = self._user32.SetWinEventHook(
+                EVENT_OBJECT_LOCATIONCHANGE,
+                EVENT_OBJECT_LOCATIONCHANGE,
+                None,
+                self._win_event_proc,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            ) or None
+        except Exception:
+            self._location_hook = None
+
+    def _remove_win_event_hooks(self):
+        """注销全部 WinEvent 钩子。"""
+        """EN: Unregister all WinEvent hooks."""
+        self._set_location_hook(False)
+        hooks = self._win_event_hooks
+        self._win_event_hooks = []
+        for hook in hooks:
+            try:
+                self._user32.UnhookWinEvent(hook)
+            except Exception:
+                pass
+        self._win_event_proc = None
+
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time):
+        """WinEvent 回调。OUTOFCONTEXT 钩子在注册线程（GUI 线程）的消息循环中回调。"""
+        """EN: WinEvent callback. OUTOFCONTEXT hooks are delivered through the message loop of the registering (GUI) thread."""
+        try:
+            if event == EVENT_OBJECT_LOCATIONCHANGE:
+                if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+                    return
+                # 窗口可能被移动到另一台显示器。
+                # EN: The window may have moved to another monitor.
+                self._monitor_rect_for_hwnd.pop(hwnd, None)
+            if not self._display_event_timer.isActive():
+                self._display_event_timer.start()
+        except Exception:
+            pass
 
     @property
     def pets(self):
-        """返回当前实例快照。供外部只读遍历。"""
-        """EN: Returns a snapshot of the current instance. For external read-only traversal."""
-        return list(self._pets)
+        """返回当前实例的不可变快照。供外部只读遍历。"""
+        """EN: Returns the immutable snapshot of current instances. For external read-only traversal."""
+        return self._pets_tuple
 
     def register_pet(self, pet):
         """注册桌宠实例并同步当前全局状态。"""
         """EN: Register the table pet instance and synchronize the current global state."""
-        if pet is None or pet in self._pets:
+        if pet is None or pet in self._pets_set:
             return
 
         self._pets.append(pet)
+        self._pets_set.add(pet)
+        self._pets_tuple = tuple(self._pets)
         pet.instance_manager = self
+        caps = {key: getattr(pet, name, None) for key, name in PET_CAPABILITIES.items()}
+        caps["sync_float"] = getattr(caps["movement"], "_sync_float_position", None)
+        pet._im_caps = caps
+        pet._im_closed = False
 
         if len(self._pets) > 1:
             self._relocate_pet_avoid_overlap(pet)
 
-        if hasattr(pet, "apply_move_enabled"):
-            pet.apply_move_enabled(self.state.move_enabled)
-        if hasattr(pet, "apply_follow_enabled"):
-            pet.apply_follow_enabled(self.state.follow_mouse)
-        if hasattr(pet, "apply_scale"):
-            pet.apply_scale(self.scale_factor)
-        if hasattr(pet, "apply_autostart"):
-            pet.apply_autostart(self.get_autostart_enabled())
-        if hasattr(pet, "apply_opacity_percent"):
-            pet.apply_opacity_percent(self.opacity_percent)
-        if hasattr(pet, "apply_language"):
-            pet.apply_language(self.language)
-        if hasattr(pet, "set_always_on_top"):
-            pet.set_always_on_top(True)
+        if self._suspend_sync:
+            self._deferred_register.append(pet)
+            return
 
+        self._apply_state_to_pet(pet, self.get_autostart_enabled())
         self._sync_multi_open_topmost()
-
         self._safe_show_or_hide_pet(pet, self._should_show_pets())
 
+    def _apply_state_to_pet(self, pet, autostart_enabled: bool):
+        """把当前全局状态应用到单个实例。"""
+        """EN: Apply the current global state to a single instance."""
+        caps = pet._im_caps
+        if caps["move"] is not None:
+            caps["move"](self.state.move_enabled)
+        if caps["follow"] is not None:
+            caps["follow"](self.state.follow_mouse)
+        if caps["scale"] is not None:
+            caps["scale"](self.scale_factor)
+        if caps["autostart"] is not None:
+            caps["autostart"](autostart_enabled)
+        if caps["opacity"] is not None:
+            caps["opacity"](self.opacity_percent)
+        if caps["language"] is not None:
+            caps["language"](self.language)
+        if caps["always_on_top"] is not None:
+            caps["always_on_top"](True)
+
+    def _flush_deferred_register(self):
+        """批量结束后一次性同步暂缓的实例，多开置顶与显示策略各只计算一次。"""
+        """EN: Synchronize deferred instances after a bulk change; multi-open topmost and display policy are computed once."""
+        pending = [pet for pet in self._deferred_register if pet in self._pets_set]
+        self._deferred_register = []
+
+        if pending:
+            autostart_enabled = self.get_autostart_enabled()
+            for pet in pending:
+                self._apply_state_to_pet(pet, autostart_enabled)
+
+        self._sync_multi_open_topmost()
+
+        if pending:
+            should_show = self._should_show_pets()
+            for pet in pending:
+                self._safe_show_or_hide_pet(pet, should_show)
+
     def _relocate_pet_avoid_overlap(self, pet):
         """为新实例寻找不重叠位置，避免与已有桌宠重合生成。"""
         """EN: Look for non-overlapping positions for new instances to avoid overlapping with existing table darlings."""
-        others = [p for p in self._pets if p is not pet]
+        others = [p for p in self._pets_tuple if p is not pet]
         if not others:
             return
 
@@ -155,35 +567,61 @@ class PetInstanceManager(QObject):
             return
 
         geometry = screen.availableGeometry()
+        geo_left = geometry.left()
+        geo_top = geometry.top()
+        geo_width = geometry.width()
+        geo_height = geometry.height()
         width = max(1, pet.width())
         height = max(1, pet.height())
         step_x = max(24, int(width * 0.8))
         step_y = max(24, int(height * 0.8))
 
+        others_rects = [_frame_box(other) for other in others]
         base = others[-1].pos()
-        max_cols = max(1, (geometry.width() - width) // step_x)
-        max_rows = max(1, (geometry.height() - height) // step_y)
-
-        for index in range(max_cols * max_rows + 1):
-            col = index % max_cols
-            row = index // max_cols
-            x = geometry.left() + ((base.x() - geometry.left()) + col * step_x) % max(1, geometry.width() - width)
-            y = geometry.top() + ((base.y() - geometry.top()) + row * step_y) % max(1, geometry.height() - height)
-
-            candidate_rect = pet.frameGeometry()
-            candidate_rect.moveTo(x, y)
-            overlap = any(candidate_rect.intersects(other.frameGeometry()) for other in others)
-            if not overlap:
+        base_x = base.x()
+        base_y = base.y()
+        max_cols = max(1, (geo_width - width) // step_x)
+        max_rows = max(1, (geo_height - height) // step_y)
+
+        span_x = max(1, geo_width - width)
+        span_y = max(1, geo_height - height)
+        offset_x = base_x - geo_left
+        offset_y = base_y - geo_top
+        xs = [geo_left + (offset_x + col * step_x) % span_x for col in range(max_cols)]
+
+        # 逐行扫描。先筛出与该行纵向相交的实例，行内候选位置只需比较横向区间。
+        # EN: Sweep row by row. Pets overlapping the row vertically are filtered once, so each candidate only compares horizontal spans.
+        for row in range(max_rows + 1):
+            y = geo_top + (offset_y + row * step_y) % span_y
+            bottom = y + height
+            band = [(r[0], r[2]) for r in others_rects if y < r[3] and r[1] < bottom]
+
+            # 原有扫描顺序共 max_cols * max_rows + 1 个候选，最后一行只有首列。
+            # EN: The original scan covers max_cols * max_rows + 1 candidates, so the last row holds only the first column.
+            cols = max_cols if row < max_rows else 1
+            for col in range(cols):
+                x = xs[col]
+                right = x + width
+                overlap = False
+                for band_left, band_right in band:
+                    if x < band_right and band_left < right:
+                        overlap = True
+                        break
+                if overlap:
+                    continue
+
                 pet.move(x, y)
-                if hasattr(pet, "movement") and hasattr(pet.movement, "_sync_float_position"):
-                    pet.movement._sync_float_position()
+                sync_float = pet._im_caps["sync_float"]
+                if sync_float is not None:
+                    sync_float()
                 return
 
-        fallback_x = min(max(geometry.left(), base.x() + step_x), geometry.right() - width)
-        fallback_y = min(max(geometry.top(), base.y() + step_y), geometry.bottom() - height)
+        fallback_x = min(max(geo_left, base_x + step_x), geometry.right() - width)
+        fallback_y = min(max(geo_top, base_y + step_y), geometry.bottom() - height)
         pet.move(fallback_x, fallback_y)
-        if hasattr(pet, "movement") and hasattr(pet.movement, "_sync_float_position"):
-            pet.movement._sync_float_position()
+        sync_float = pet._im_caps["sync_float"]
+        if sync_float is not None:
+            sync_float()
 
     def _resolve_pet_collisions(self):
         """处理多桌宠碰撞。碰撞后反向移动并分离重叠区域。"""
@@ -191,38 +629,57 @@ class PetInstanceManager(QObject):
         if len(self._pets) < 2:
             return
 
-        pets = [p for p in self._pets if hasattr(p, "movement")]
-        for i in range(len(pets)):
-            left_pet = pets[i]
-            if getattr(left_pet.state, "is_dragging", False):
-                continue
+        pets = [
+            p for p in self._pets_tuple
+            if p._im_caps["movement"] is not None and not getattr(p.state, "is_dragging", False)
+        ]
+        if len(pets) < 2:
+            return
 
-            left_rect = left_pet.frameGeometry()
-            for j in range(i + 1, len(pets)):
-                right_pet = pets[j]
-                if getattr(right_pet.state, "is_dragging", False):
+        # 按左上角落入均匀网格。格宽不小于最大边长，重叠的两实例必在同格或相邻格。
+        # EN: Bucket by top-left corner into a uniform grid. With cells at least as large as the biggest pet, overlapping pets share a cell or sit in neighbouring cells.
+        rects = [_frame_box(p) for p in pets]
+        cell = max(1, max(max(r[2] - r[0], r[3] - r[1]) for r in rects))
+        grid = defaultdict(list)
+        for index, r in enumerate(rects):
+            grid[(r[0] // cell, r[1] // cell)].append(index)
+
+        pairs = []
+        for (cx, cy), bucket in grid.items():
+            for n, i in enumerate(bucket):
+                for j in bucket[n + 1:]:
+                    pairs.append((i, j))
+            for dx, dy in _GRID_FORWARD_NEIGHBORS:
+                neighbor = grid.get((cx + dx, cy + dy))
+                if not neighbor:
                     continue
+                for i in bucket:
+                    for j in neighbor:
+                        pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
 
-                right_rect = right_pet.frameGeometry()
-                if not left_rect.intersects(right_rect):
-                    continue
+        for i, j in pairs:
+            if not _aabb_overlap(rects[i], rects[j]):
+                continue
 
-                self._bounce_two_pets(left_pet, right_pet, left_rect, right_rect)
-                left_rect = left_pet.frameGeometry()
+            first_pet = pets[i]
+            second_pet = pets[j]
+            self._bounce_two_pets(first_pet, second_pet, rects[i], rects[j])
+            rects[i] = _frame_box(first_pet)
+            rects[j] = _frame_box(second_pet)
 
     def _bounce_two_pets(self, first_pet, second_pet, first_rect, second_rect):
-        """执行两实例碰撞反弹与位置分离。"""
-        """EN: Perform two instances of collision bounce and position separation."""
-        intersection = first_rect.intersected(second_rect)
-        if intersection.isEmpty():
+        """执行两实例碰撞反弹与位置分离。矩形为 (left, top, right, bottom) 元组。"""
+        """EN: Perform two instances of collision bounce and position separation. Rects are (left, top, right, bottom) tuples."""
+        overlap_w, overlap_h = _aabb_intersect_wh(first_rect, second_rect)
+        if overlap_w <= 0 or overlap_h <= 0:
             return
 
-        overlap_w = intersection.width()
-        overlap_h = intersection.height()
-
         if overlap_w <= overlap_h:
             shift = max(1, overlap_w // 2 + 1)
-            if first_rect.center().x() <= second_rect.center().x():
+            # 比较中心时用两倍坐标，省去除法。
+            # EN: Compare doubled centres to skip the division.
+            if first_rect[0] + first_rect[2] <= second_rect[0] + second_rect[2]:
                 first_dx = -shift
                 second_dx = shift
             else:
@@ -232,7 +689,7 @@ class PetInstanceManager(QObject):
             second_dy = 0
         else:
             shift = max(1, overlap_h // 2 + 1)
-            if first_rect.center().y() <= second_rect.center().y():
+            if first_rect[1] + first_rect[3] <= second_rect[1] + second_rect[3]:
                 first_dy = -shift
                 second_dy = shift
             else:
@@ -258,25 +715,33 @@ class PetInstanceManager(QObject):
         """按位移调整实例位置并约束屏幕边界。"""
         """EN: Adjusts the instance position by displacement and constrains the screen boundaries."""
         pet.move(pet.x() + dx, pet.y() + dy)
-        if hasattr(pet, "movement"):
-            pet.movement.constrain_to_screen()
-            if hasattr(pet.movement, "_sync_float_position"):
-                pet.movement._sync_float_position()
+        caps = pet._im_caps
+        if caps["movement"] is not None:
+            caps["movement"].constrain_to_screen()
+            if caps["sync_float"] is not None:
+                caps["sync_float"]()
 
     def unregister_pet(self, pet):
         """注销桌宠实例。"""
         """EN: Log out of the table pet instance."""
-        if pet in self._pets:
+        if pet in self._pets_set:
+            self._pets_set.discard(pet)
             self._pets.remove(pet)
-            self._sync_multi_open_topmost()
+            self._pets_tuple = tuple(self._pets)
+            # 清除可见性记录。实例再次注册时按真实状态重新下发 show/hide。
+            # EN: Drop the visibility record so a re-registered pet gets show/hide applied from scratch.
+            pet._im_last_visible = None
+            if not self._suspend_sync:
+                self._sync_multi_open_topmost()
 
     def _sync_multi_open_topmost(self):
         """多开(>=2)时所有实例临时置顶，单实例时恢复为用户显示优先级。"""
         """EN: When more open (> = 2), all instances are temporarily pinned to the top, and when single instance is restored, the priority is displayed for the user."""
         force_topmost = len(self._pets) >= 2
-        for pet in list(self._pets):
-            if hasattr(pet, "set_force_topmost_for_multi"):
-                pet.set_force_topmost_for_multi(force_topmost)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["topmost_multi"]
+            if fn is not None:
+                fn(force_topmost)
 
     def set_spawn_callback(self, callback):
         """设置补齐实例时的创建回调。"""
@@ -297,9 +762,10 @@ class PetInstanceManager(QObject):
         """设置全部实例移动状态并同步广播。"""
         """EN: Set all instances to move state and synchronize broadcasts."""
         self.state.move_enabled = bool(enabled)
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_move_enabled"):
-                pet.apply_move_enabled(self.state.move_enabled)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["move"]
+            if fn is not None:
+                fn(self.state.move_enabled)
         self.move_enabled_changed.emit(self.state.move_enabled)
 
     def get_move_enabled(self) -> bool:
@@ -315,11 +781,15 @@ class PetInstanceManager(QObject):
     def on_set_follow(self, enabled):
         """设置全局跟随状态并同步所有实例。"""
         """EN: Sets the global follower state and synchronizes all instances."""
+        if bool(enabled) == self.state.follow_mouse:
+            return
+
         self.state.follow_mouse = bool(enabled)
         self.settings_store.set_follow_mouse(self.state.follow_mouse)
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_follow_enabled"):
-                pet.apply_follow_enabled(self.state.follow_mouse)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["follow"]
+            if fn is not None:
+                fn(self.state.follow_mouse)
         self.follow_changed.emit(self.state.follow_mouse)
 
     def on_set_scale(self, scale: float):
@@ -330,17 +800,29 @@ class PetInstanceManager(QObject):
         except (TypeError, ValueError):
             return
 
+        if normalized == self.scale_factor:
+            return
+
         self.scale_factor = normalized
         self.settings_store.set_scale_factor(normalized)
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_scale"):
-                pet.apply_scale(self.scale_factor)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["scale"]
+            if fn is not None:
+                fn(self.scale_factor)
         self.scale_changed.emit(self.scale_factor)
 
     def get_autostart_enabled(self) -> bool:
-        """读取系统开机自启状态。"""
-        """EN: Read the system power on and off status."""
-        return is_autostart_enabled()
+        """读取系统开机自启状态。使用缓存值，避免重复读取注册表。"""
+        """EN: Read the system power on and off status. Uses the cached value to avoid repeated registry reads."""
+        if self._autostart_cached is None:
+            self._autostart_cached = is_autostart_enabled()
+        return self._autostart_cached
+
+    def refresh_autostart(self) -> bool:
+        """丢弃缓存并重新读取注册表。用于外部修改了自启项的场景。"""
+        """EN: Drop the cache and re-read the registry. For cases where the Run entry was changed externally."""
+        self._autostart_cached = None
+        return self.get_autostart_enabled()
 
     def on_toggle_autostart(self, checked=False):
         """切换开机自启。参数为菜单/控件传入的目标状态。"""
@@ -351,10 +833,19 @@ class PetInstanceManager(QObject):
         """设置开机自启并同步所有实例。"""
         """EN: Set boot to self-start and synchronize all instances."""
         target = bool(enabled)
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_autostart"):
-                pet.apply_autostart(target)
-        self.autostart_changed.emit(target)
+        if target == self.get_autostart_enabled():
+            return
+
+        # 写入成功与否以注册表为准：写完（或写入失败）后重新读取，缓存不会领先于真实状态。
+        # EN: The registry is the source of truth: re-read it after the write (or a failed write), so the cache never runs ahead of the real state.
+        try:
+            for pet in self._pets_tuple:
+                fn = pet._im_caps["autostart"]
+                if fn is not None:
+                    fn(target)
+        finally:
+            actual = self.refresh_autostart()
+        self.autostart_changed.emit(actual)
 
     def on_set_opacity_percent(self, percent: int):
         """设置全局透明度并同步所有实例。"""
@@ -365,12 +856,16 @@ class PetInstanceManager(QObject):
             normalized = OPACITY_DEFAULT_PERCENT
 
         normalized = max(OPACITY_PERCENT_MIN, min(OPACITY_PERCENT_MAX, normalized))
+        if normalized == self.opacity_percent:
+            return
+
         self.opacity_percent = normalized
         self.settings_store.set_opacity_percent(normalized)
 
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_opacity_percent"):
-                pet.apply_opacity_percent(normalized)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["opacity"]
+            if fn is not None:
+                fn(normalized)
 
         self.opacity_changed.emit(normalized)
 
@@ -382,21 +877,23 @@ class PetInstanceManager(QObject):
     def on_set_display_mode(self, mode: str):
         """设置显示模式并持久化。"""
         """EN: Sets the display mode and persists."""
-        if mode not in {
-            DISPLAY_MODE_ALWAYS_ON_TOP,
-            DISPLAY_MODE_FULLSCREEN_HIDE,
-            DISPLAY_MODE_DESKTOP_ONLY,
-        }:
-            mode = DISPLAY_MODE_ALWAYS_ON_TOP
+        bit = _DISPLAY_MODE_BIT.get(mode, DISPLAY_FLAG_ALWAYS_ON_TOP)
+        mode = _DISPLAY_BIT_MODE[bit]
+
+        if mode == self.display_mode:
+            return
 
         self.display_mode = mode
+        self._display_mode_flags = bit
         self.settings_store.set_display_mode(mode)
 
-        for pet in list(self._pets):
-            if hasattr(pet, "set_always_on_top"):
-                pet.set_always_on_top(True)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["always_on_top"]
+            if fn is not None:
+                fn(True)
 
         self.display_mode_changed.emit(self.display_mode)
+        self._update_display_polling()
         self._apply_display_policy()
 
     def get_display_mode(self) -> str:
@@ -414,20 +911,30 @@ class PetInstanceManager(QObject):
 
         target = max(INSTANCE_COUNT_MIN, min(INSTANCE_COUNT_MAX, target))
         self.target_count = target
-        self.settings_store.set_instance_count(target)
-
-        while len(self._pets) < self.target_count:
-            if self._spawn_callback is None:
-                break
-            spawned = self._spawn_callback()
-            if spawned is None:
-                break
-            if spawned not in self._pets:
-                self.register_pet(spawned)
-
-        if len(self._pets) > self.target_count:
-            self.close_random_pets(len(self._pets) - self.target_count, update_target=False)
 
+        self._suspend_sync = True
+        try:
+            while len(self._pets) < self.target_count:
+                if self._pet_pool:
+                    pooled = self._pet_pool.pop()
+                    pooled._im_caps["resume_from_pool"]()
+                    self.register_pet(pooled)
+                    continue
+                if self._spawn_callback is None:
+                    break
+                spawned = self._spawn_callback()
+                if spawned is None:
+                    break
+                if spawned not in self._pets_set:
+                    self.register_pet(spawned)
+
+            if len(self._pets) > self.target_count:
+                self.close_random_pets(len(self._pets) - self.target_count, update_target=False)
+        finally:
+            self._suspend_sync = False
+
+        self._flush_deferred_register()
+        self.settings_store.set_instance_count(self.target_count)
         self.instance_count_changed.emit(self.target_count)
 
     def get_instance_count(self) -> int:
@@ -439,12 +946,16 @@ class PetInstanceManager(QObject):
         """设置界面语言并同步所有实例。"""
         """EN: Set the interface language and sync all instances."""
         normalized = normalize_language(language)
+        if normalized == self.language:
+            return
+
         self.language = normalized
         self.settings_store.set_language(normalized)
 
-        for pet in list(self._pets):
-            if hasattr(pet, "apply_language"):
-                pet.apply_language(normalized)
+        for pet in self._pets_tuple:
+            fn = pet._im_caps["language"]
+            if fn is not None:
+                fn(normalized)
 
         self.language_changed.emit(normalized)
 
@@ -456,7 +967,7 @@ class PetInstanceManager(QObject):
     def close_current_pet(self, pet):
         """关闭指定桌宠实例。"""
         """EN: Close the specified table pet instance."""
-        if pet not in self._pets:
+        if pet not in self._pets_set:
             return
 
         self._close_pet_instance(pet)
@@ -477,7 +988,13 @@ class PetInstanceManager(QObject):
             return
 
         actual_close = min(target_close, len(self._pets))
-        selected = random.sample(list(self._pets), actual_close)
+        # 关闭会修改 self._pets 并重建快照元组。旧元组不受影响，可直接作为待关闭序列。
+        # EN: Closing mutates self._pets and rebuilds the snapshot tuple; the old tuple is untouched, so it serves as the selection directly.
+        pets = self._pets_tuple
+        if actual_close == len(pets):
+            selected = pets
+        else:
+            selected = random.sample(pets, actual_close)
         for pet in selected:
             self._close_pet_instance(pet)
 
@@ -499,20 +1016,36 @@ class PetInstanceManager(QObject):
         self.instance_count_changed.emit(self.target_count)
 
     def _close_pet_instance(self, pet):
-        """执行单实例关闭流程。"""
-        """EN: Performs a single-instance shutdown process."""
-        if pet not in self._pets:
+        """执行单实例关闭流程。实例提供 reset_for_pool()/resume_from_pool() 时回收到实例池，否则销毁。"""
+        """EN: Performs a single-instance shutdown process. Instances exposing reset_for_pool()/resume_from_pool() are recycled into the pool instead of destroyed."""
+        if pet not in self._pets_set:
             return
 
         self.unregister_pet(pet)
+        pet._im_closed = True
+
+        caps = pet._im_caps
+        if caps["reset_for_pool"] is not None and len(self._pet_pool) < INSTANCE_COUNT_MAX:
+            # 回收而非销毁。下次扩容时直接复用，省去窗口与动画的重建。
+            # EN: Recycle instead of destroying. The next grow reuses it and skips rebuilding the window and movies.
+            caps["reset_for_pool"]()
+            pet._im_last_visible = False
+            self._pet_pool.append(pet)
+            return
 
+        self._dispose_pet(pet)
+
+    def _dispose_pet(self, pet):
+        """彻底销毁单个实例。"""
+        """EN: Destroy a single instance for good."""
+        caps = pet._im_caps
         try:
-            if hasattr(pet, "prepare_for_exit") and callable(pet.prepare_for_exit):
-                pet.prepare_for_exit()
-            if hasattr(pet, "close") and callable(pet.close):
-                pet.close()
-            if hasattr(pet, "deleteLater") and callable(pet.deleteLater):
-                pet.deleteLater()
+            if caps["prepare_exit"] is not None:
+                caps["prepare_exit"]()
+            if caps["close"] is not None:
+                caps["close"]()
+            if caps["delete_later"] is not None:
+                caps["delete_later"]()
         except Exception:
             pass
 
@@ -521,91 +1054,118 @@ class PetInstanceManager(QObject):
         """EN: Stop the manager timer and release all table darling instances."""
         self._spawn_callback = None
 
-        if self._display_timer.isActive():
-            self._display_timer.stop()
-        if self._collision_timer.isActive():
-            self._collision_timer.stop()
+        self._remove_win_event_hooks()
+        if self._display_event_timer.isActive():
+            self._display_event_timer.stop()
+        if self._tick_timer.isActive():
+            self._tick_timer.stop()
 
         try:
-            self._display_timer.timeout.disconnect(self._apply_display_policy)
+            self._tick_timer.timeout.disconnect(self._on_tick)
         except Exception:
             pass
         try:
-            self._collision_timer.timeout.disconnect(self._resolve_pet_collisions)
+            self._display_event_timer.timeout.disconnect(self._apply_display_policy)
         except Exception:
             pass
 
-        pets = list(self._pets)
+        pooled = self._pet_pool[:]
+        self._pet_pool.clear()
+        for pet in pooled:
+            self._dispose_pet(pet)
+
+        pets = self._pets_tuple
         self._pets.clear()
+        self._pets_tuple = ()
+        self._pets_set.clear()
         for pet in pets:
-            try:
-                if hasattr(pet, "prepare_for_exit") and callable(pet.prepare_for_exit):
-                    pet.prepare_for_exit()
-                if hasattr(pet, "close") and callable(pet.close):
-                    pet.close()
-                if hasattr(pet, "deleteLater") and callable(pet.deleteLater):
-                    pet.deleteLater()
-            except Exception:
-                pass
+            pet._im_closed = True
+            self._dispose_pet(pet)
 
         try:
-            self._display_timer.deleteLater()
-            self._collision_timer.deleteLater()
+            self._tick_timer.deleteLater()
+            self._display_event_timer.deleteLater()
         except Exception:
             pass
 
     def _apply_display_policy(self):
         """按显示模式定时控制实例可见性。异常时默认显示。"""
         """EN: Timing control instance visibility by display mode. Displayed by default when abnormal."""
+        # 置顶模式且已处于显示状态时无事可做。
+        # EN: Nothing to do in always-on-top mode once pets are already shown.
+        if self._display_mode_flags & DISPLAY_FLAG_ALWAYS_ON_TOP and self._last_should_show:
+            return
+
+        self._class_name_cache_tick += 1
+        if self._class_name_cache_tick >= CLASS_NAME_CACHE_AGE_PASSES:
+            self._class_name_cache_tick = 0
+            self._class_name_cache.clear()
+
         should_show = self._should_show_pets()
+        self._adapt_display_poll(should_show)
+
+        # 显示决策未变化时无需逐个实例调用 show/hide。
+        # EN: Nothing to propagate while the display decision is unchanged.
+        if should_show == self._last_should_show:
+            return
 
         # 从全屏隐藏恢复到可显示时，强制恢复全部实例显示，避免遗漏。
         # EN: When recovering from full-screen hiding to displayable, force recovery of all instance displays to avoid omission.
         if should_show and not self._last_should_show:
             self._restore_all_hidden_pets()
 
-        for pet in list(self._pets):
-            self._safe_show_or_hide_pet(pet, should_show)
-
         self._last_should_show = should_show
+        for pet in self._pets_tuple:
+            self._safe_show_or_hide_pet(pet, should_show)
 
     def _restore_all_hidden_pets(self):
         """恢复所有已隐藏实例的可见状态。"""
         """EN: Restore the visible state of all hidden instances."""
-        for pet in list(self._pets):
+        for pet in self._pets_tuple:
+            caps = pet._im_caps
             try:
-                if hasattr(pet, "isVisible") and not pet.isVisible():
-                    pet.show()
+                if caps["is_visible"] is not None and not caps["is_visible"]() and caps["show"] is not None:
+                    caps["show"]()
+                pet._im_last_visible = True
             except Exception:
                 pass
 
     def _safe_show_or_hide_pet(self, pet, should_show: bool):
-        """安全执行显示/隐藏。异常时回退为显示。"""
-        """EN: Safely execute show/hide. Fallback to display when abnormal."""
-        try:
-            if should_show:
-                if hasattr(pet, "show"):
-                    pet.show()
-                return
-            if hasattr(pet, "hide"):
-                pet.hide()
-        except Exception:
-            try:
-                if hasattr(pet, "show"):
-                    pet.show()
-            except Exception:
-                pass
+        """执行显示/隐藏。已关闭的实例直接跳过，不再依赖异常兜底。"""
+        """EN: Execute show/hide. Closed instances are skipped up front instead of relying on an exception fallback."""
+        if pet._im_closed or getattr(pet, "_im_last_visible", None) is should_show:
+            return
+
+        # 先记录再调用，实例的 hideEvent 据此区分管理器下发的隐藏与实例自行隐藏。
+        # EN: Recorded before the call, so the pet's hideEvent can tell a manager-driven hide from the pet hiding itself.
+        pet._im_last_visible = should_show
+        fn = pet._im_caps["show"] if should_show else pet._im_caps["hide"]
+        if fn is not None:
+            fn()
+
+    def notify_pet_hidden(self, pet):
+        """实例隐藏时回调。若并非管理器下发，则清除可见性记录并尽快重新计算显示策略。"""
+        """EN: Called when a pet is hidden. Unless the manager hid it, the visibility record is cleared and the display policy is re-run shortly."""
+        if pet not in self._pets_set or pet._im_closed or getattr(pet, "_im_last_visible", None) is False:
+            return
+        pet._im_last_visible = None
+        # 清除上次决策，跳过置顶模式与“决策未变化”的提前返回。
+        # EN: Clear the last decision so the always-on-top and "decision unchanged" early returns do not apply.
+        self._last_should_show = None
+        if not self._display_event_timer.isActive():
+            self._display_event_timer.start()
 
     def _should_show_pets(self) -> bool:
         """根据当前显示模式计算是否应显示桌宠。"""
         """EN: Calculate whether the table pet should be displayed based on the current display mode."""
-        if self.display_mode == DISPLAY_MODE_ALWAYS_ON_TOP:
+        flags = self._display_mode_flags
+        if flags & DISPLAY_FLAG_ALWAYS_ON_TOP:
             return True
 
         try:
-            if self.display_mode == DISPLAY_MODE_FULLSCREEN_HIDE:
+            if flags & DISPLAY_FLAG_FULLSCREEN_HIDE:
                 return not self._is_top_visible_window_blocking()
-            if self.display_mode == DISPLAY_MODE_DESKTOP_ONLY:
+            if flags & DISPLAY_FLAG_DESKTOP_ONLY:
                 return self._is_foreground_desktop_window()
             return True
         except Exception:
@@ -624,7 +1184,7 @@ class PetInstanceManager(QObject):
         """收集当前桌宠实例窗口句柄。"""
         """EN: Collect current desktop-pet window handles."""
         handles: set[int] = set()
-        for pet in list(self._pets):
+        for pet in self._pets_tuple:
             try:
                 hwnd = int(pet.winId())
             except Exception:
@@ -639,7 +1199,7 @@ class PetInstanceManager(QObject):
         if not hwnd or self._user32 is None:
             return False
         try:
-            return bool(self._user32.IsZoomed(hwnd))
+            return bool(self._IsZoomed(hwnd))
         except Exception:
             return False
 
@@ -654,34 +1214,34 @@ class PetInstanceManager(QObject):
         foreground = self._get_valid_foreground_window()
         if foreground and foreground not in pet_handles:
             class_name = self._get_class_name(foreground)
-            if class_name not in {"Progman", "WorkerW"}:
+            if class_name not in DESKTOP_WINDOW_CLASSES:
                 return foreground
 
-        hwnd = self._user32.GetTopWindow(0)
-        gw_hwndnext = 2
-        while hwnd:
-            if not self._user32.IsWindow(hwnd):
-                hwnd = self._user32.GetWindow(hwnd, gw_hwndnext)
-                continue
-            if not self._user32.IsWindowVisible(hwnd):
-                hwnd = self._user32.GetWindow(hwnd, gw_hwndnext)
-                continue
-            if self._user32.IsIconic(hwnd):
-                hwnd = self._user32.GetWindow(hwnd, gw_hwndnext)
-                continue
-
-            if hwnd in pet_handles:
-                hwnd = self._user32.GetWindow(hwnd, gw_hwndnext)
-                continue
-
-            class_name = self._get_class_name(hwnd)
-            if class_name in {"Progman", "WorkerW"}:
-                hwnd = self._user32.GetWindow(hwnd, gw_hwndnext)
-                continue
-
-            return hwnd
+        # EnumWindows 按 Z 序从上到下枚举顶层窗口，回调命中第一个合格窗口后立即停止枚举。
+        # EN: EnumWindows walks top-level windows in Z order; the callback stops the walk at the first acceptable window.
+        self._enum_pet_handles = pet_handles
+        self._enum_result = 0
+        try:
+            self._EnumWindows(self._enum_windows_proc, 0)
+        finally:
+            self._enum_pet_handles = set()
+        return self._enum_result
+
+    def _on_enum_window(self, hwnd, lparam):
+        """EnumWindows 回调。返回 False 终止枚举。"""
+        """EN: EnumWindows callback. Returning False stops the enumeration."""
+        try:
+            if not self._IsWindowVisible(hwnd) or self._IsIconic(hwnd):
+                return True
+            if hwnd in self._enum_pet_handles:
+                return True
+            if self._get_class_name(hwnd) in DESKTOP_WINDOW_CLASSES:
+                return True
+        except Exception:
+            return True
 
-        return 0
+        self._enum_result = hwnd
+        return False
 
     def _is_foreground_desktop_window(self) -> bool:
         """判断前台窗口是否为桌面窗口（Progman/WorkerW）。"""
@@ -691,7 +1251,7 @@ class PetInstanceManager(QObject):
             return True
 
         class_name = self._get_class_name(hwnd)
-        return class_name in {"Progman", "WorkerW"}
+        return class_name in DESKTOP_WINDOW_CLASSES
 
     def _is_foreground_fullscreen(self) -> bool:
         """判断前台窗口是否处于全屏状态。"""
@@ -709,72 +1269,96 @@ class PetInstanceManager(QObject):
             return False
 
         class_name = self._get_class_name(hwnd)
-        if class_name in {"Progman", "WorkerW"}:
+        if class_name in DESKTOP_WINDOW_CLASSES:
             return False
 
         # 窗口化（有标题栏/可调整边框）即使尺寸很大，也不按“全屏隐藏”处理。
         # EN: Windowing (with title bar/adjustable border) is not handled by Hidden Full Screen even if it is large in size.
         try:
-            style = self._user32.GetWindowLongW(hwnd, GWL_STYLE)
+            style = self._GetWindowLongW(hwnd, GWL_STYLE)
             if style & (WS_CAPTION | WS_THICKFRAME):
                 return False
         except Exception:
             pass
 
-        rect = RECT()
-        if not self._user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        rect = self._rect_buf
+        if not self._GetWindowRect(hwnd, self._rect_ref):
             return False
 
         if rect.right <= rect.left or rect.bottom <= rect.top:
             return False
 
-        monitor = self._user32.MonitorFromWindow(hwnd, 2)
-        if not monitor:
-            return False
-
-        monitor_info = MONITORINFO()
-        monitor_info.cbSize = ctypes.sizeof(MONITORINFO)
-        if not self._user32.GetMonitorInfoW(monitor, ctypes.byref(monitor_info)):
+        monitor_rect = self._get_monitor_rect(hwnd)
+        if monitor_rect is None:
             return False
 
-        monitor_rect = monitor_info.rcMonitor
+        monitor_left, monitor_top, monitor_right, monitor_bottom = monitor_rect
         tolerance = 2
         return (
-            rect.left <= monitor_rect.left + tolerance
-            and rect.top <= monitor_rect.top + tolerance
-            and rect.right >= monitor_rect.right - tolerance
-            and rect.bottom >= monitor_rect.bottom - tolerance
+            rect.left <= monitor_left + tolerance
+            and rect.top <= monitor_top + tolerance
+            and rect.right >= monitor_right - tolerance
+            and rect.bottom >= monitor_bottom - tolerance
         )
 
+    def _get_monitor_rect(self, hwnd):
+        """返回窗口所在显示器矩形 (left, top, right, bottom)。同一窗口复用缓存结果。"""
+        """EN: Return the monitor rect (left, top, right, bottom) for a window. Reuses the cached result for the same window."""
+        cached = self._monitor_rect_for_hwnd.get(hwnd)
+        if cached is not None:
+            return cached
+
+        monitor = self._MonitorFromWindow(hwnd, 2)
+        if not monitor:
+            return None
+
+        if not self._GetMonitorInfoW(monitor, self._monitor_info_ref):
+            return None
+
+        rc = self._monitor_info_buf.rcMonitor
+        monitor_rect = (rc.left, rc.top, rc.right, rc.bottom)
+        self._monitor_rect_for_hwnd.clear()
+        self._monitor_rect_for_hwnd[hwnd] = monitor_rect
+        return monitor_rect
+
     def _get_valid_foreground_window(self):
         """获取可用的前台窗口句柄。无效、不可见或最小化窗口会被忽略。"""
         """EN: Gets the available foreground window handle. Invalid, invisible or minimized windows are ignored."""
         if self._user32 is None:
             return 0
 
-        hwnd = self._user32.GetForegroundWindow()
+        hwnd = self._GetForegroundWindow()
         if not hwnd:
             return 0
 
-        if not self._user32.IsWindow(hwnd):
+        if not self._IsWindow(hwnd):
+            self._class_name_cache.pop(hwnd, None)
             return 0
 
-        if not self._user32.IsWindowVisible(hwnd):
+        if not self._IsWindowVisible(hwnd):
             return 0
 
-        if self._user32.IsIconic(hwnd):
+        if self._IsIconic(hwnd):
             return 0
 
         return hwnd
 
     def _get_class_name(self, hwnd) -> str:
-        """读取窗口类名。"""
-        """EN: Reads the window class name."""
+        """读取窗口类名。类名在窗口生命周期内不变，按句柄缓存。"""
+        """EN: Reads the window class name. Class names never change during a window's lifetime, so they are cached per handle."""
         if self._user32 is None or not hwnd:
             return ""
 
-        buffer = ctypes.create_unicode_buffer(256)
-        length = self._user32.GetClassNameW(hwnd, buffer, 256)
+        cached = self._class_name_cache.get(hwnd)
+        if cached is not None:
+            return cached
+
+        length = self._GetClassNameW(hwnd, self._class_name_buf, 256)
         if length <= 0:
             return ""
-        return buffer.value
+
+        class_name = self._class_name_buf.value
+        if len(self._class_name_cache) >= CLASS_NAME_CACHE_MAX:
+            self._class_name_cache.pop(next(iter(self._class_name_cache)))
+        self._class_name_cache[hwnd] = class_name
+        return class_name
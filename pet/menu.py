@@ -1,9 +1,11 @@
 ﻿"""该模块负责构建右键菜单。包含显示模式与多开控制。"""
 """EN: This module builds the right-click context menu, including display modes and multi-instance controls."""
 
+from functools import lru_cache, partial
+
 from PySide6.QtGui import QAction, QActionGroup
 from PySide6.QtWidgets import QMenu, QSlider, QWidgetAction, QLabel, QHBoxLayout, QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from .config import (
     DISPLAY_MODE_ALWAYS_ON_TOP,
@@ -20,84 +22,158 @@ from .config import (
 )
 from .i18n import get_language_items, normalize_language, tr
 
+# 缩放/透明度档位与标签、语言选项在运行期不变，导入时一次性计算。
+# EN: Scale/opacity steps with their labels and the language options never change at runtime, so they are computed once at import.
+_SCALE_VALUES = tuple(
+    round(SCALE_MIN + i * SCALE_STEP, 1)
+    for i in range(int(round((SCALE_MAX - SCALE_MIN) / SCALE_STEP)) + 1)
+)
+_SCALE_LABELS = tuple(f"{value:.1f}x" for value in _SCALE_VALUES)
+_OPACITY_VALUES = tuple(range(OPACITY_MENU_MIN, OPACITY_PERCENT_MAX + 1, OPACITY_MENU_STEP))
+_OPACITY_LABELS = tuple(f"{value}%" for value in _OPACITY_VALUES)
+_LANGUAGE_ITEMS = tuple(get_language_items())
+
+# 拖动音量滑条时合并 valueChanged，停顿该毫秒数后才写入播放器。
+# EN: valueChanged bursts from dragging the volume slider are coalesced; the player is only written after this many ms of quiet.
+VOLUME_SLIDER_DEBOUNCE_MS = 30
+
+_MENU_STRING_KEYS = (
+    "app.open_main",
+    "menu.follow_mouse",
+    "menu.move.stop",
+    "menu.move.resume",
+    "menu.scale",
+    "menu.opacity",
+    "menu.display_mode",
+    "menu.display.always_top",
+    "menu.display.fullscreen_hide",
+    "menu.display.desktop_only",
+    "menu.multi_instance",
+    "menu.autostart",
+    "menu.language",
+    "menu.close",
+    "menu.close_current",
+    "menu.close_random",
+    "menu.close_all",
+    "menu.music",
+    "menu.music.prev",
+    "menu.music.play",
+    "menu.music.pause",
+    "menu.music.next",
+    "menu.music.mode.list",
+    "menu.music.mode.single",
+    "menu.music.mode.random",
+)
+
+
+@lru_cache(maxsize=4)
+def _menu_strings(language: str) -> dict[str, str]:
+    """返回某语言下菜单用到的全部文案。按语言缓存，翻译表运行期不变，切换语言无需清缓存。"""
+    """EN: Return every menu string for a language. Cached per language; the translation table is static, so switching languages needs no cache clear."""
+    strings = {key: tr(language, key) for key in _MENU_STRING_KEYS}
+    strings["menu.set_instance_count"] = tr(
+        language, "menu.set_instance_count", min_count=INSTANCE_COUNT_MIN, max_count=INSTANCE_COUNT_MAX
+    )
+    return strings
+
+
+@lru_cache(maxsize=8)
+def _pet_type_caps(pet_type) -> frozenset:
+    """返回桌宠类型提供的可选菜单接口。方法随类固定，按类型缓存，弹出菜单时不再逐项探测。"""
+    """EN: Return the optional menu hooks a pet type provides. Methods are fixed per class, so this is cached per type instead of probed on every popup."""
+    return frozenset(
+        name for name in ("get_opacity_percent", "get_display_mode") if callable(getattr(pet_type, name, None))
+    )
+
+
+def _trigger_with(callback, value, checked=False):
+    """QAction.triggered 槽适配。丢弃 checked 参数，以预绑定的值调用回调。"""
+    """EN: QAction.triggered slot adapter. Drops the checked argument and calls the callback with the pre-bound value."""
+    callback(value)
+
+
+def _restart_timer(timer: QTimer, _value=None):
+    """信号槽适配。丢弃信号参数并重新启动单次计时器。"""
+    """EN: Signal slot adapter. Drops the signal argument and restarts the single-shot timer."""
+    timer.start()
+
+
+def _apply_slider_volume(music_player, vol_slider: QSlider):
+    """音量防抖计时器槽。把滑条当前的 0~100 值转换为播放器音量。"""
+    """EN: Volume debounce timer slot. Converts the slider's current 0~100 value to the player volume."""
+    music_player.set_volume(vol_slider.value() / 100.0)
+
 
 def build_context_menu(pet, music_player=None, language: str = "zh-CN", on_set_language=None) -> QMenu:
     """构建并返回右键菜单。菜单项绑定桌宠实例回调。"""
     """EN: Build and return to the context menu. Menu item binding table pet instance callback."""
     language = normalize_language(language)
+    strings = _menu_strings(language)
     menu = QMenu(pet)
-
-    if hasattr(pet, "on_open_main") and callable(pet.on_open_main):
-        open_main_action = QAction(tr(language, "app.open_main"), menu)
-        open_main_action.triggered.connect(pet.on_open_main)
+    menu.setProperty("lang", language)
+    menu._music_player = music_player
+    # 动态状态所需的动作引用按组直接挂在菜单上，刷新时无需 findChild 遍历对象树。
+    # EN: Action references needed for dynamic state hang directly off the menu per group, so refreshing needs no findChild tree walk.
+    menu._scale_actions = []
+    menu._opacity_actions = []
+    menu._display_actions = []
+    menu._language_actions = []
+    menu._mode_actions = []
+    menu._track_name_action = None
+    menu._play_pause_action = None
+    menu._vol_slider = None
+
+    on_open_main = getattr(pet, "on_open_main", None)
+    if callable(on_open_main):
+        open_main_action = QAction(strings["app.open_main"], menu)
+        open_main_action.triggered.connect(on_open_main)
         menu.addAction(open_main_action)
         menu.addSeparator()
 
     stop_action = QAction(menu)
-    stop_action.setObjectName("toggleMoveAction")
     stop_action.triggered.connect(pet.on_toggle_move_current)
     menu.addAction(stop_action)
+    menu._toggle_action = stop_action
 
-    follow_action = QAction(tr(language, "menu.follow_mouse"), menu)
-    follow_action.setObjectName("followAction")
+    follow_action = QAction(strings["menu.follow_mouse"], menu)
     follow_action.setCheckable(True)
     follow_action.setChecked(pet.state.follow_mouse)
     follow_action.triggered.connect(pet.on_toggle_follow)
     menu.addAction(follow_action)
+    menu._follow_action = follow_action
 
     # 创建缩放二级菜单。范围 0.1x~2.0x，步进 0.1x。
     # EN: Creates a zoom secondary menu. Range 0.1x~2.0x, step 0.1x.
-    scale_menu = menu.addMenu(tr(language, "menu.scale"))
-    count = int(round((SCALE_MAX - SCALE_MIN) / SCALE_STEP)) + 1
-    for i in range(count):
-        value = round(SCALE_MIN + i * SCALE_STEP, 1)
-        action = QAction(f"{value:.1f}x", scale_menu)
-        action.setCheckable(True)
-        action.setChecked(abs(pet.scale_factor - value) < 1e-6)
-        action.triggered.connect(lambda checked=False, s=value: pet.on_set_scale(s))
-        scale_menu.addAction(action)
+    # 缩放、透明度与音乐子菜单在首次展开时才填充。
+    # EN: The scale, opacity and music submenus are populated the first time they are shown.
+    scale_menu = menu.addMenu(strings["menu.scale"])
+    scale_menu.aboutToShow.connect(partial(_populate_scale_menu_once, menu, scale_menu, pet))
 
-    opacity_menu = menu.addMenu(tr(language, "menu.opacity"))
-    current_opacity = (
-        pet.get_opacity_percent()
-        if hasattr(pet, "get_opacity_percent") and callable(pet.get_opacity_percent)
-        else OPACITY_PERCENT_MAX
-    )
-    opacity_group = QActionGroup(opacity_menu)
-    opacity_group.setExclusive(True)
-    for value in range(OPACITY_MENU_MIN, OPACITY_PERCENT_MAX + 1, OPACITY_MENU_STEP):
-        action = QAction(f"{value}%", opacity_menu)
-        action.setCheckable(True)
-        action.setChecked(int(current_opacity) == value)
-        action.triggered.connect(lambda checked=False, p=value: pet.on_set_opacity_percent(p))
-        opacity_group.addAction(action)
-        opacity_menu.addAction(action)
+    opacity_menu = menu.addMenu(strings["menu.opacity"])
+    opacity_menu.aboutToShow.connect(partial(_populate_opacity_menu_once, menu, opacity_menu, pet))
 
-    display_mode_menu = menu.addMenu(tr(language, "menu.display_mode"))
-    current_mode = (
-        pet.get_display_mode()
-        if hasattr(pet, "get_display_mode") and callable(pet.get_display_mode)
-        else DISPLAY_MODE_ALWAYS_ON_TOP
-    )
+    display_mode_menu = menu.addMenu(strings["menu.display_mode"])
     display_group = QActionGroup(display_mode_menu)
-    display_group.setExclusive(True)
+    # QActionGroup 默认即为互斥（ExclusionPolicy.Exclusive），无需再调用 setExclusive。
+    # EN: QActionGroup is exclusive by default (ExclusionPolicy.Exclusive), so setExclusive is not called.
 
     display_items = [
-        (tr(language, "menu.display.always_top"), DISPLAY_MODE_ALWAYS_ON_TOP),
-        (tr(language, "menu.display.fullscreen_hide"), DISPLAY_MODE_FULLSCREEN_HIDE),
-        (tr(language, "menu.display.desktop_only"), DISPLAY_MODE_DESKTOP_ONLY),
+        (strings["menu.display.always_top"], DISPLAY_MODE_ALWAYS_ON_TOP),
+        (strings["menu.display.fullscreen_hide"], DISPLAY_MODE_FULLSCREEN_HIDE),
+        (strings["menu.display.desktop_only"], DISPLAY_MODE_DESKTOP_ONLY),
     ]
     for text, mode in display_items:
         action = QAction(text, display_mode_menu)
         action.setCheckable(True)
-        action.setChecked(current_mode == mode)
-        action.triggered.connect(lambda checked=False, m=mode: pet.on_set_display_mode(m))
+        action.setData(mode)
+        action.triggered.connect(partial(_trigger_with, pet.on_set_display_mode, mode))
         display_group.addAction(action)
         display_mode_menu.addAction(action)
+        menu._display_actions.append((action, mode))
 
-    multi_instance_menu = menu.addMenu(tr(language, "menu.multi_instance"))
+    multi_instance_menu = menu.addMenu(strings["menu.multi_instance"])
     set_count_action = QAction(
-        tr(language, "menu.set_instance_count", min_count=INSTANCE_COUNT_MIN, max_count=INSTANCE_COUNT_MAX),
+        strings["menu.set_instance_count"],
         multi_instance_menu,
     )
     set_count_action.triggered.connect(pet.on_set_instance_count_prompt)
@@ -105,40 +181,39 @@ def build_context_menu(pet, music_player=None, language: str = "zh-CN", on_set_l
 
     # 创建开机自启开关。勾选状态由当前系统配置决定。
     # EN: Create a power-on auto-on switch. The checked status is determined by the current system configuration.
-    autostart_action = QAction(tr(language, "menu.autostart"), menu)
+    autostart_action = QAction(strings["menu.autostart"], menu)
     autostart_action.setCheckable(True)
-    autostart_action.setChecked(pet.get_autostart_enabled())
     autostart_action.triggered.connect(pet.on_toggle_autostart)
     menu.addAction(autostart_action)
+    menu._autostart_action = autostart_action
 
-    language_menu = menu.addMenu(tr(language, "menu.language"))
+    language_menu = menu.addMenu(strings["menu.language"])
     language_group = QActionGroup(language_menu)
-    language_group.setExclusive(True)
-    current_language = language
-    for code, display_name in get_language_items():
+    for code, display_name in _LANGUAGE_ITEMS:
         language_action = QAction(display_name, language_menu)
         language_action.setCheckable(True)
-        language_action.setChecked(code == current_language)
+        language_action.setData(code)
         if on_set_language is not None:
-            language_action.triggered.connect(lambda checked=False, c=code: on_set_language(c))
+            language_action.triggered.connect(partial(_trigger_with, on_set_language, code))
         language_group.addAction(language_action)
         language_menu.addAction(language_action)
+        menu._language_actions.append((language_action, code))
 
     # 将关闭项置于分隔线后。降低误触风险。
     # EN: Place the closing item after the separator line. Reduce the risk of accidental contact.
     menu.addSeparator()
 
-    close_menu = menu.addMenu(tr(language, "menu.close"))
+    close_menu = menu.addMenu(strings["menu.close"])
 
-    close_current_action = QAction(tr(language, "menu.close_current"), close_menu)
+    close_current_action = QAction(strings["menu.close_current"], close_menu)
     close_current_action.triggered.connect(pet.on_close_current_pet)
     close_menu.addAction(close_current_action)
 
-    close_random_action = QAction(tr(language, "menu.close_random"), close_menu)
+    close_random_action = QAction(strings["menu.close_random"], close_menu)
     close_random_action.triggered.connect(pet.on_close_random_pets_prompt)
     close_menu.addAction(close_random_action)
 
-    close_all_action = QAction(tr(language, "menu.close_all"), close_menu)
+    close_all_action = QAction(strings["menu.close_all"], close_menu)
     close_all_action.triggered.connect(pet.on_close_all_pets)
     close_menu.addAction(close_all_action)
 
@@ -146,98 +221,218 @@ def build_context_menu(pet, music_player=None, language: str = "zh-CN", on_set_l
     # EN: Music Submenu (Simplified Control)
     if music_player is not None:
         menu.addSeparator()
-        music_menu = menu.addMenu(tr(language, "menu.music"))
-
-        # 当前歌曲名（只读）
-        # EN: Current song title (read-only)
-        track_name_action = QAction(music_player.current_track_name, music_menu)
-        track_name_action.setObjectName("musicTrackNameAction")
-        track_name_action.setEnabled(False)
-        music_menu.addAction(track_name_action)
-
-        music_menu.addSeparator()
-
-        # 上一首
-        # EN: Previous
-        prev_action = QAction(tr(language, "menu.music.prev"), music_menu)
-        prev_action.triggered.connect(music_player.prev)
-        music_menu.addAction(prev_action)
-
-        # 播放/暂停（动态文字）
-        # EN: Play/Pause (Dynamic Text)
-        play_pause_text = tr(language, "menu.music.pause") if music_player.is_playing else tr(language, "menu.music.play")
-        play_pause_action = QAction(play_pause_text, music_menu)
-        play_pause_action.setObjectName("musicPlayPauseAction")
-        play_pause_action.triggered.connect(music_player.toggle_pause)
-        music_menu.addAction(play_pause_action)
-
-        # 下一首
-        # EN: up next
-        next_action = QAction(tr(language, "menu.music.next"), music_menu)
-        next_action.triggered.connect(music_player.next)
-        music_menu.addAction(next_action)
-
-        music_menu.addSeparator()
-
-        # 播放模式（互斥单选）
-        # EN: Play Mode (Mutually Exclusive Radio)
-        from .music import PLAY_MODE_LIST, PLAY_MODE_SINGLE, PLAY_MODE_RANDOM, MODE_ICONS
-        mode_group = QActionGroup(music_menu)
-        mode_group.setExclusive(True)
-        for mode_key, mode_label in [
-            (PLAY_MODE_LIST, f"{MODE_ICONS[PLAY_MODE_LIST]} {tr(language, 'menu.music.mode.list')}"),
-            (PLAY_MODE_SINGLE, f"{MODE_ICONS[PLAY_MODE_SINGLE]} {tr(language, 'menu.music.mode.single')}"),
-            (PLAY_MODE_RANDOM, f"{MODE_ICONS[PLAY_MODE_RANDOM]} {tr(language, 'menu.music.mode.random')}"),
-        ]:
-            mode_action = QAction(mode_label, music_menu)
-            mode_action.setCheckable(True)
-            mode_action.setChecked(music_player.play_mode == mode_key)
-            mode_action.triggered.connect(lambda checked=False, m=mode_key: music_player.set_mode(m))
-            mode_group.addAction(mode_action)
-            music_menu.addAction(mode_action)
-
-        music_menu.addSeparator()
-
-        # 音量滑条（嵌入 QWidgetAction）
-        # EN: Volume slider (embedded with QWidgetAction)
-        vol_widget = QWidget()
-        vol_layout = QHBoxLayout(vol_widget)
-        vol_layout.setContentsMargins(8, 4, 8, 4)
-        vol_label = QLabel("🔈")
-        vol_layout.addWidget(vol_label)
-        vol_slider = QSlider(Qt.Orientation.Horizontal)
-        vol_slider.setRange(0, 100)
-        vol_slider.setValue(int(music_player.volume * 100))
-        vol_slider.setFixedWidth(120)
-        vol_slider.valueChanged.connect(lambda v: music_player.set_volume(v / 100.0))
-        vol_layout.addWidget(vol_slider)
-        vol_action = QWidgetAction(music_menu)
-        vol_action.setDefaultWidget(vol_widget)
-        music_menu.addAction(vol_action)
+        music_menu = menu.addMenu(strings["menu.music"])
+        music_menu.aboutToShow.connect(partial(_populate_music_menu_once, menu, music_menu, music_player, language))
 
     sync_context_menu_state(menu, pet, music_player, language=language)
     return menu
 
 
+def _populate_scale_menu_once(menu: QMenu, scale_menu: QMenu, pet):
+    """首次展开时填充缩放子菜单。范围 0.1x~2.0x，步进 0.1x。"""
+    """EN: Populate the scale submenu on first show. Range 0.1x~2.0x, step 0.1x."""
+    if scale_menu.property("built"):
+        return
+    scale_menu.setProperty("built", True)
+
+    for value, label in zip(_SCALE_VALUES, _SCALE_LABELS):
+        action = QAction(label, scale_menu)
+        action.setCheckable(True)
+        action.setData(value)
+        action.triggered.connect(partial(_trigger_with, pet.on_set_scale, value))
+        scale_menu.addAction(action)
+        menu._scale_actions.append((action, value))
+
+    _sync_scale_actions(menu._scale_actions, pet.scale_factor)
+
+
+def _populate_opacity_menu_once(menu: QMenu, opacity_menu: QMenu, pet):
+    """首次展开时填充透明度子菜单。"""
+    """EN: Populate the opacity submenu on first show."""
+    if opacity_menu.property("built"):
+        return
+    opacity_menu.setProperty("built", True)
+
+    opacity_group = QActionGroup(opacity_menu)
+    for value, label in zip(_OPACITY_VALUES, _OPACITY_LABELS):
+        action = QAction(label, opacity_menu)
+        action.setCheckable(True)
+        action.setData(value)
+        action.triggered.connect(partial(_trigger_with, pet.on_set_opacity_percent, value))
+        opacity_group.addAction(action)
+        opacity_menu.addAction(action)
+        menu._opacity_actions.append((action, value))
+
+    _sync_checked(menu._opacity_actions, _current_opacity(pet))
+
+
+def _populate_music_menu_once(menu: QMenu, music_menu: QMenu, music_player, language: str):
+    """首次展开时填充音乐子菜单（简化控制），音量滑条也在此时才创建。"""
+    """EN: Populate the music submenu (simplified controls) on first show; the volume slider is only created here."""
+    if music_menu.property("built"):
+        return
+    music_menu.setProperty("built", True)
+    strings = _menu_strings(language)
+
+    # 当前歌曲名（只读）
+    # EN: Current song title (read-only)
+    track_name_action = QAction(music_player.current_track_name, music_menu)
+    track_name_action.setEnabled(False)
+    music_menu.addAction(track_name_action)
+    menu._track_name_action = track_name_action
+
+    music_menu.addSeparator()
+
+    # 上一首
+    # EN: Previous
+    prev_action = QAction(strings["menu.music.prev"], music_menu)
+    prev_action.triggered.connect(music_player.prev)
+    music_menu.addAction(prev_action)
+
+    # 播放/暂停（动态文字）
+    # EN: Play/Pause (Dynamic Text)
+    play_pause_text = strings["menu.music.pause"] if music_player.is_playing else strings["menu.music.play"]
+    play_pause_action = QAction(play_pause_text, music_menu)
+    play_pause_action.triggered.connect(music_player.toggle_pause)
+    music_menu.addAction(play_pause_action)
+    menu._play_pause_action = play_pause_action
+
+    # 下一首
+    # EN: up next
+    next_action = QAction(strings["menu.music.next"], music_menu)
+    next_action.triggered.connect(music_player.next)
+    music_menu.addAction(next_action)
+
+    music_menu.addSeparator()
+
+    # 播放模式（互斥单选）
+    # EN: Play Mode (Mutually Exclusive Radio)
+    from .music import PLAY_MODE_LIST, PLAY_MODE_SINGLE, PLAY_MODE_RANDOM, MODE_ICONS
+    mode_group = QActionGroup(music_menu)
+    for mode_key, mode_label in [
+        (PLAY_MODE_LIST, f"{MODE_ICONS[PLAY_MODE_LIST]} {strings['menu.music.mode.list']}"),
+        (PLAY_MODE_SINGLE, f"{MODE_ICONS[PLAY_MODE_SINGLE]} {strings['menu.music.mode.single']}"),
+        (PLAY_MODE_RANDOM, f"{MODE_ICONS[PLAY_MODE_RANDOM]} {strings['menu.music.mode.random']}"),
+    ]:
+        mode_action = QAction(mode_label, music_menu)
+        mode_action.setCheckable(True)
+        mode_action.setData(mode_key)
+        mode_action.triggered.connect(partial(_trigger_with, music_player.set_mode, mode_key))
+        mode_group.addAction(mode_action)
+        music_menu.addAction(mode_action)
+        menu._mode_actions.append((mode_action, mode_key))
+
+    music_menu.addSeparator()
+
+    # 音量滑条（嵌入 QWidgetAction）
+    # EN: Volume slider (embedded with QWidgetAction)
+    vol_widget = QWidget()
+    vol_layout = QHBoxLayout(vol_widget)
+    vol_layout.setContentsMargins(8, 4, 8, 4)
+    vol_label = QLabel("🔈")
+    vol_layout.addWidget(vol_label)
+    vol_slider = QSlider(Qt.Orientation.Horizontal)
+    vol_slider.setRange(0, 100)
+    vol_slider.setFixedWidth(120)
+    vol_apply_timer = QTimer(vol_slider)
+    vol_apply_timer.setSingleShot(True)
+    vol_apply_timer.setInterval(VOLUME_SLIDER_DEBOUNCE_MS)
+    vol_apply_timer.timeout.connect(partial(_apply_slider_volume, music_player, vol_slider))
+    vol_slider.valueChanged.connect(partial(_restart_timer, vol_apply_timer))
+    vol_layout.addWidget(vol_slider)
+    vol_action = QWidgetAction(music_menu)
+    vol_action.setDefaultWidget(vol_widget)
+    music_menu.addAction(vol_action)
+    menu._vol_slider = vol_slider
+
+    _sync_music_state(menu, music_player, language)
+
+
+def get_or_build_context_menu(pet, music_player=None, language: str = "zh-CN", on_set_language=None) -> QMenu:
+    """返回可复用的右键菜单。语言与音乐播放器未变时复用 pet._context_menu，否则新建。"""
+    """EN: Return a reusable context menu. Reuses pet._context_menu while the language and music player are unchanged, otherwise builds a new one."""
+    language = normalize_language(language)
+    menu = getattr(pet, "_context_menu", None)
+    if (
+        menu is not None
+        and menu.property("lang") == language
+        and getattr(menu, "_music_player", None) is music_player
+    ):
+        sync_context_menu_state(menu, pet, music_player, language=language)
+        return menu
+    return build_context_menu(pet, music_player, language=language, on_set_language=on_set_language)
+
+
+def _current_opacity(pet) -> int:
+    """读取当前透明度百分比。"""
+    """EN: Read the current opacity percentage."""
+    if "get_opacity_percent" in _pet_type_caps(type(pet)):
+        return int(pet.get_opacity_percent())
+    return OPACITY_PERCENT_MAX
+
+
+def _sync_scale_actions(actions, scale_factor: float):
+    """按当前缩放值刷新缩放动作勾选态。"""
+    """EN: Refresh the scale actions' check state from the current scale."""
+    for action, value in actions:
+        checked = abs(scale_factor - value) < 1e-6
+        if action.isChecked() != checked:
+            action.setChecked(checked)
+
+
+def _sync_checked(actions, current):
+    """勾选 (动作, 值) 列表中值与当前值相同的动作。"""
+    """EN: Check the action in an (action, value) list whose value equals the current value."""
+    for action, value in actions:
+        checked = value == current
+        if action.isChecked() != checked:
+            action.setChecked(checked)
+
+
 def sync_context_menu_state(menu: QMenu, pet, music_player=None, language: str = "zh-CN"):
-    """刷新右键菜单动态状态（停止/恢复文案与勾选态）。"""
-    """EN: Refresh the right-click menu dynamic state (stop/resume copy and check)."""
+    """刷新右键菜单动态状态（停止/恢复文案与各项勾选态）。缓存菜单每次弹出前调用。"""
+    """EN: Refresh the right-click menu dynamic state (stop/resume copy and every check state). Called before each popup of the cached menu."""
     language = normalize_language(language)
-    toggle_action = menu.findChild(QAction, "toggleMoveAction")
-    if toggle_action is not None:
-        toggle_action.setText(tr(language, "menu.move.resume") if not pet.state.move_enabled else tr(language, "menu.move.stop"))
+    strings = _menu_strings(language)
+    menu._toggle_action.setText(strings["menu.move.resume"] if not pet.state.move_enabled else strings["menu.move.stop"])
+    menu._follow_action.setChecked(bool(pet.state.follow_mouse))
 
-    follow_action = menu.findChild(QAction, "followAction")
-    if follow_action is not None:
-        follow_action.setChecked(bool(pet.state.follow_mouse))
+    _sync_scale_actions(menu._scale_actions, pet.scale_factor)
+    _sync_checked(menu._opacity_actions, _current_opacity(pet))
+
+    current_mode = (
+        pet.get_display_mode()
+        if "get_display_mode" in _pet_type_caps(type(pet))
+        else DISPLAY_MODE_ALWAYS_ON_TOP
+    )
+    _sync_checked(menu._display_actions, current_mode)
+
+    menu._autostart_action.setChecked(bool(pet.get_autostart_enabled()))
+
+    _sync_checked(menu._language_actions, language)
 
     if music_player is not None:
-        track_name_action = menu.findChild(QAction, "musicTrackNameAction")
-        if track_name_action is not None:
-            track_name_action.setText(music_player.current_track_name)
-
-        play_pause_action = menu.findChild(QAction, "musicPlayPauseAction")
-        if play_pause_action is not None:
-            play_pause_action.setText(
-                tr(language, "menu.music.pause") if music_player.is_playing else tr(language, "menu.music.play")
-            )
+        _sync_music_state(menu, music_player, language)
+
+
+def _sync_music_state(menu: QMenu, music_player, language: str):
+    """刷新音乐相关动态状态。子菜单尚未填充时各项均为空，直接跳过。"""
+    """EN: Refresh the music-related dynamic state. Items are skipped while the submenu is not yet populated."""
+    if menu._track_name_action is None:
+        return
+    strings = _menu_strings(language)
+    menu._track_name_action.setText(music_player.current_track_name)
+    menu._play_pause_action.setText(
+        strings["menu.music.pause"] if music_player.is_playing else strings["menu.music.play"]
+    )
+
+    _sync_checked(menu._mode_actions, music_player.play_mode)
+
+    vol_slider = menu._vol_slider
+    volume = int(music_player.volume * 100)
+    if vol_slider.value() != volume:
+        # 同步显示值时不回写播放器。
+        # EN: Do not write back to the player while syncing the displayed value.
+        vol_slider.blockSignals(True)
+        vol_slider.setValue(volume)
+        vol_slider.blockSignals(False)
@@ -4,7 +4,7 @@
 import random
 import time
 
-from PySide6.QtCore import QPoint, QRect
+from PySide6.QtCore import QPoint, QRect, QTimer
 from PySide6.QtGui import QCursor
 from PySide6.QtWidgets import QApplication
 
@@ -14,6 +14,107 @@ from .config import (
     MOVE_TICK_MS,
 )
 
+# 单轴方向取值表。模块级元组，避免每次换向都新建列表。
+# EN: Per-axis direction tables. Module-level tuples, so a direction change never builds a new list.
+_AXIS_DIRECTIONS = (-1.0, 0.0, 1.0)
+_MOVING_DIRECTIONS = (-1.0, 1.0)
+
+# 位置与速度以 1/256 像素的定点整数保存，主循环只做整数加法与移位。
+# EN: Position and velocity are kept as fixed-point integers in 1/256 px, so the main loop only does integer adds and shifts.
+_SUBPIXEL_SHIFT = 8
+_SUBPIXEL_ONE = 1 << _SUBPIXEL_SHIFT
+_SUBPIXEL_HALF = _SUBPIXEL_ONE >> 1
+
+
+class MovementScheduler:
+    """这是全体桌宠共用的移动节拍。一个计时器按 MOVE_TICK_MS 依次驱动所有已注册的控制器，全部空闲时停表。"""
+    """EN: Movement clock shared by every pet. One timer drives all registered controllers at MOVE_TICK_MS and stops while all of them are idle."""
+
+    def __init__(self):
+        """创建共享计时器。首个控制器注册时启动，最后一个注销时停止。"""
+        """EN: Create the shared timer. It starts with the first registered controller and stops after the last one leaves."""
+        self._timer = QTimer()
+        self._timer.setInterval(MOVE_TICK_MS)
+        self._timer.timeout.connect(self._on_tick)
+        self._controllers: list = []
+        # 各桌宠主循环的绑定方法快照。注册变化时重建，节拍内不再逐个查找属性。
+        # EN: Snapshot of each pet's bound main-loop method. Rebuilt on registration changes so a tick does no per-pet attribute lookups.
+        self._tick_calls: tuple = ()
+        self._cursor = None
+        # 屏幕被移除时，依附该屏幕的区域缓存不会收到 availableGeometryChanged，需要在这里统一失效。
+        # EN: Bounds cached for a removed screen never see availableGeometryChanged, so they are invalidated here instead.
+        QApplication.instance().screenRemoved.connect(self._on_screen_removed)
+
+    def add(self, controller):
+        """注册控制器。"""
+        """EN: Register a controller."""
+        if controller in self._controllers:
+            return
+        self._controllers.append(controller)
+        self._tick_calls = tuple(controller.pet._tick for controller in self._controllers)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, controller):
+        """注销控制器。"""
+        """EN: Unregister a controller."""
+        if controller not in self._controllers:
+            return
+        self._controllers.remove(controller)
+        self._tick_calls = tuple(controller.pet._tick for controller in self._controllers)
+        if not self._controllers:
+            self._timer.stop()
+
+    def contains(self, controller) -> bool:
+        """返回控制器是否已注册。"""
+        """EN: Whether the controller is registered."""
+        return controller in self._controllers
+
+    def wake(self):
+        """唤醒已停表的节拍。桌宠离开空闲状态时调用。"""
+        """EN: Restart the clock if it was stopped. Called when a pet leaves an idle state."""
+        if self._controllers and not self._timer.isActive():
+            self._timer.start()
+
+    def cursor_pos(self) -> QPoint:
+        """返回本次节拍的鼠标位置。同一节拍内只读取一次。"""
+        """EN: Cursor position for the current tick, read at most once per tick."""
+        if self._cursor is None:
+            self._cursor = QCursor.pos()
+        return self._cursor
+
+    def _on_screen_removed(self, screen):
+        """屏幕移除时丢弃各控制器中依附该屏幕的区域缓存。"""
+        """EN: Drop every controller's bounds cached for a screen that was removed."""
+        for controller in self._controllers:
+            if controller._bounds_screen is screen:
+                controller._bounds_screen = None
+                controller._bounds = None
+                controller._limits = None
+
+    def _on_tick(self):
+        """依次执行各桌宠主循环。全部桌宠都处于空闲（拖拽、休息、停止移动）时停表，等待 wake 再启动。"""
+        """EN: Run each pet's main loop in turn. When every pet is idle (dragging, resting or stopped) the timer stops until wake is called."""
+        self._cursor = None
+        active = False
+        for tick in self._tick_calls:
+            if tick():
+                active = True
+        if not active:
+            self._timer.stop()
+
+
+_scheduler = None
+
+
+def get_movement_scheduler() -> MovementScheduler:
+    """返回共享移动节拍。首次调用时创建（需在 QApplication 创建之后）。"""
+    """EN: Return the shared movement clock, created on first use (after the QApplication exists)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = MovementScheduler()
+    return _scheduler
+
 
 class MovementController:
     """这是桌宠位移控制器。统一管理速度、浮点坐标和边界行为。"""
@@ -23,44 +124,168 @@ class MovementController:
         """初始化移动控制状态。设置速度、浮点坐标和触边停顿计时字段。"""
         """EN: Initializes the movement control state. Set the speed, floating point coordinates, and touch pause timing fields."""
         self.pet = pet
-        self.velocity_x = 1.0
-        self.velocity_y = 0.0
-        self.float_x = float(pet.x())
-        self.float_y = float(pet.y())
-        self.pause_until_ms = 0
+        self._vx_q8 = _SUBPIXEL_ONE
+        self._vy_q8 = 0
+        self._fx_q8 = pet.x() << _SUBPIXEL_SHIFT
+        self._fy_q8 = pet.y() << _SUBPIXEL_SHIFT
+        self.pause_until_ns = 0
         self.tick_count = 0
         self.direction_change_interval_ticks = max(1, int(round(3000 / MOVE_TICK_MS)))
         self.next_horizontal_change_tick = 0
         self.next_vertical_change_tick = 0
+        # 所在屏幕可用区域缓存 (left, top, right, bottom, width, height)。屏幕可用区域变化或桌宠离开该区域时重新读取。
+        # EN: Cached available area of the current screen as (left, top, right, bottom, width, height). Re-read when the area changes or the pet leaves it.
+        self._bounds = None
+        self._bounds_screen = None
+        # 桌宠窗口尺寸缓存 (width, height)。仅在窗口尺寸变化（缩放）时失效。
+        # EN: Cached pet window size as (width, height). Invalidated only when the window is resized (scaling).
+        self._pet_size = None
+        # 窗口左上角可取范围 (min_x, max_x, min_y, max_y)。由区域与尺寸缓存派生，任一失效时一并丢弃。
+        # EN: Allowed range of the window's top-left corner as (min_x, max_x, min_y, max_y). Derived from the area and size caches and dropped with either.
+        self._limits = None
+        # 基准速度缓存。仅在屏幕尺寸或桌宠尺寸变化时重算。
+        # EN: Base speed cache, recomputed only when the screen or pet size changes.
+        self._speed_key = None
+        self._base_speeds = (0.2, 0.2)
+        self._follow_max_step = 1
+        # 上次未发生位移的跟随输入 (鼠标, 位置, 尺寸, 屏幕区域) 及其触边结果。输入不变时结果也不变，直接复用。
+        # EN: Inputs (cursor, position, size, screen area) of the last follow update that did not move, plus its edge result. Same inputs give the same result, so it is reused.
+        self._follow_idle_key = None
+        self._follow_idle_blocked = False
+
+    @property
+    def velocity_x(self) -> float:
+        """横向速度（像素/tick）。"""
+        """EN: Horizontal velocity in px per tick."""
+        return self._vx_q8 / _SUBPIXEL_ONE
+
+    @velocity_x.setter
+    def velocity_x(self, value: float):
+        self._vx_q8 = int(round(value * _SUBPIXEL_ONE))
+
+    @property
+    def velocity_y(self) -> float:
+        """纵向速度（像素/tick）。"""
+        """EN: Vertical velocity in px per tick."""
+        return self._vy_q8 / _SUBPIXEL_ONE
+
+    @velocity_y.setter
+    def velocity_y(self, value: float):
+        self._vy_q8 = int(round(value * _SUBPIXEL_ONE))
+
+    def start_ticking(self):
+        """加入共享移动节拍。"""
+        """EN: Join the shared movement clock."""
+        get_movement_scheduler().add(self)
+
+    def stop_ticking(self):
+        """退出共享移动节拍。"""
+        """EN: Leave the shared movement clock."""
+        get_movement_scheduler().remove(self)
+
+    def wake_ticking(self):
+        """桌宠离开空闲状态时唤醒共享节拍。"""
+        """EN: Wake the shared clock when the pet leaves an idle state."""
+        if _scheduler is not None:
+            _scheduler.wake()
+
+    def is_ticking(self) -> bool:
+        """返回是否在共享移动节拍中。"""
+        """EN: Whether this controller is on the shared movement clock."""
+        return _scheduler is not None and _scheduler.contains(self)
+
+    def _invalidate_geometry_cache(self, *args):
+        """丢弃屏幕区域缓存。连接到 QScreen.availableGeometryChanged。"""
+        """EN: Drop the screen area cache. Connected to QScreen.availableGeometryChanged."""
+        self._bounds = None
+        self._limits = None
+
+    def invalidate_pet_size(self):
+        """丢弃桌宠尺寸缓存。由桌宠窗口的 resizeEvent 调用。"""
+        """EN: Drop the pet size cache. Called from the pet window's resizeEvent."""
+        self._pet_size = None
+        self._limits = None
+
+    def _get_pet_size(self) -> tuple[int, int]:
+        """返回桌宠窗口尺寸 (width, height)。"""
+        """EN: Return the pet window size as (width, height)."""
+        size = self._pet_size
+        if size is None:
+            size = (self.pet.width(), self.pet.height())
+            self._pet_size = size
+        return size
+
+    def _get_bounds(self) -> tuple:
+        """返回当前屏幕可用区域 (left, top, right, bottom, width, height)。桌宠中心仍在缓存区域内时直接复用。"""
+        """EN: Return the current screen's available area as (left, top, right, bottom, width, height). Reused while the pet centre stays inside the cached area."""
+        bounds = self._bounds
+        if bounds is not None:
+            pet_w, pet_h = self._get_pet_size()
+            center_x = self.pet.x() + pet_w // 2
+            center_y = self.pet.y() + pet_h // 2
+            if bounds[0] <= center_x <= bounds[2] and bounds[1] <= center_y <= bounds[3]:
+                return bounds
+
+        screen = QApplication.screenAt(self.pet.frameGeometry().center()) or QApplication.primaryScreen()
+        if screen is not self._bounds_screen:
+            if self._bounds_screen is not None:
+                try:
+                    self._bounds_screen.availableGeometryChanged.disconnect(self._invalidate_geometry_cache)
+                except Exception:
+                    pass
+            screen.availableGeometryChanged.connect(self._invalidate_geometry_cache)
+            self._bounds_screen = screen
+
+        geometry: QRect = screen.availableGeometry()
+        bounds = (
+            geometry.left(),
+            geometry.top(),
+            geometry.right(),
+            geometry.bottom(),
+            geometry.width(),
+            geometry.height(),
+        )
+        self._bounds = bounds
+        self._limits = None
+        return bounds
+
+    def _get_limits(self, bounds: tuple) -> tuple:
+        """返回窗口左上角可取范围 (min_x, max_x, min_y, max_y)。bounds 须为刚由 _get_bounds 返回的区域。"""
+        """EN: Return the allowed top-left range as (min_x, max_x, min_y, max_y). bounds must be the area just returned by _get_bounds."""
+        limits = self._limits
+        if limits is None:
+            pet_w, pet_h = self._get_pet_size()
+            limits = (bounds[0], bounds[2] - pet_w, bounds[1], bounds[3] - pet_h)
+            self._limits = limits
+        return limits
+
+    def _get_base_speeds(self, bounds: tuple) -> tuple[float, float]:
+        """返回 (横向, 纵向) 基准速度。屏幕与桌宠尺寸不变时复用缓存，同时缓存跟随步长。"""
+        """EN: Return the (horizontal, vertical) base speeds. Reused while screen and pet sizes are unchanged; the follow step is cached alongside."""
+        key = (bounds[4], bounds[5]) + self._get_pet_size()
+        if key != self._speed_key:
+            # 目标是约 20 秒横穿/纵穿可用区域。可移动距离需扣除桌宠自身尺寸，总耗时除以主循环间隔得到 tick 总数。
+            # EN: Aim to cross the available area in about 20 seconds. Travel distance excludes the pet's own size; total time over the loop interval gives the tick count.
+            ticks = max(1.0, (CROSS_SCREEN_SECONDS * 1000.0) / MOVE_TICK_MS)
+            speed_x = max(0.2, max(1, key[0] - key[2]) / ticks)
+            speed_y = max(0.2, max(1, key[1] - key[3]) / ticks)
+            self._base_speeds = (speed_x, speed_y)
+            # 跟随速度基于分辨率。使用基准速度乘以跟随倍率。
+            # EN: Follow speed is based on resolution. Use the reference speed multiplied by the following magnification.
+            self._follow_max_step = max(1, int(round(speed_x * FOLLOW_SPEED_MULTIPLIER)))
+            self._speed_key = key
+        return self._base_speeds
 
     def _sync_float_position(self):
-        """同步浮点坐标到窗口坐标。避免长时间移动产生累计误差。"""
-        """EN: Synchronize floating point coordinates to window coordinates. Avoid cumulative errors with prolonged movement."""
-        self.float_x = float(self.pet.x())
-        self.float_y = float(self.pet.y())
-
-    def _base_speed_x(self, geometry: QRect) -> float:
-        """按分辨率计算横向基准速度。目标是约 20 秒横穿可用宽度。"""
-        """EN: Calculates the lateral reference velocity by resolution. The goal is to traverse the available width for about 20 seconds."""
-        # 先计算可移动横向距离。宽度需扣除桌宠自身宽度。
-        # EN: Calculate the movable lateral distance first. The width shall be deducted from the width of the table pet itself.
-        travel_px = max(1, geometry.width() - self.pet.width())
-        # 再换算每 tick 位移。总耗时除以主循环间隔得到 tick 总数。
-        # EN: Then convert the displacement per tick. The total time spent divided by the main loop interval gives the total number of ticks.
-        ticks = max(1.0, (CROSS_SCREEN_SECONDS * 1000.0) / MOVE_TICK_MS)
-        return max(0.2, travel_px / ticks)
-
-    def _base_speed_y(self, geometry: QRect) -> float:
-        """按分辨率计算纵向基准速度。目标是约 20 秒纵穿可用高度。"""
-        """EN: Calculates the longitudinal reference velocity by resolution. The goal is to traverse the available altitude for about 20 seconds."""
-        travel_px = max(1, geometry.height() - self.pet.height())
-        ticks = max(1.0, (CROSS_SCREEN_SECONDS * 1000.0) / MOVE_TICK_MS)
-        return max(0.2, travel_px / ticks)
+        """同步亚像素坐标到窗口坐标。窗口被外部移动后调用，丢弃残留的小数部分。"""
+        """EN: Synchronize the sub-pixel coordinates to the window position. Called after the window is moved externally; drops any leftover fraction."""
+        self._fx_q8 = self.pet.x() << _SUBPIXEL_SHIFT
+        self._fy_q8 = self.pet.y() << _SUBPIXEL_SHIFT
 
     def _randomized_speed(self, base_speed: float) -> float:
         """在基准速度上应用随机浮动。范围为 0.8x~1.2x。"""
         """EN: Apply a random float on the reference velocity. The range is 0.8x~1.2x."""
-        factor = random.uniform(0.8, 1.2)
+        factor = 0.8 + 0.4 * random.random()
         return max(0.2, base_speed * factor)
 
     def _maybe_update_horizontal_velocity(self, base_speed_x: float):
@@ -70,8 +295,7 @@ class MovementController:
             return
 
         horizontal_speed = self._randomized_speed(base_speed_x)
-        direction = random.choice([-1, 0, 1])
-        self.velocity_x = float(direction) * horizontal_speed
+        self.velocity_x = random.choice(_AXIS_DIRECTIONS) * horizontal_speed
         self.next_horizontal_change_tick = self.tick_count + self.direction_change_interval_ticks
 
     def _maybe_update_vertical_velocity(self, base_speed_y: float):
@@ -81,8 +305,7 @@ class MovementController:
             return
 
         vertical_speed = self._randomized_speed(base_speed_y)
-        direction = random.choice([-1, 0, 1])
-        self.velocity_y = float(direction) * vertical_speed
+        self.velocity_y = random.choice(_AXIS_DIRECTIONS) * vertical_speed
         self.next_vertical_change_tick = self.tick_count + self.direction_change_interval_ticks
 
     def place_initial(self):
@@ -98,21 +321,21 @@ class MovementController:
     def constrain_to_screen(self):
         """约束窗口不越界。将窗口夹紧在当前屏幕可用区域内。"""
         """EN: Constraint window is not out of bounds. Clamp the window within the available area of the current screen."""
-        screen = QApplication.screenAt(self.pet.frameGeometry().center()) or QApplication.primaryScreen()
-        geometry: QRect = screen.availableGeometry()
+        left, top, right, bottom, _, _ = self._get_bounds()
+        pet_w, pet_h = self._get_pet_size()
 
         x = self.pet.x()
         y = self.pet.y()
 
-        if x < geometry.left():
-            x = geometry.left()
-        if x + self.pet.width() > geometry.right():
-            x = geometry.right() - self.pet.width()
+        if x < left:
+            x = left
+        if x + pet_w > right:
+            x = right - pet_w
 
-        if y < geometry.top():
-            y = geometry.top()
-        if y + self.pet.height() > geometry.bottom():
-            y = geometry.bottom() - self.pet.height()
+        if y < top:
+            y = top
+        if y + pet_h > bottom:
+            y = bottom - pet_h
 
         self.pet.move(x, y)
         self._sync_float_position()
@@ -120,34 +343,38 @@ class MovementController:
     def follow_cursor_tick(self) -> tuple[bool, bool]:
         """执行一次跟随鼠标更新。返回(是否发生位移, 是否因触边被阻挡)。"""
         """EN: Perform a follow mouse update. Returns (whether displacement occurs or is blocked by touch edges)."""
-        cursor = QCursor.pos()
-        target = QPoint(cursor.x() - self.pet.width() // 2, cursor.y() - self.pet.height() // 2)
-
-        screen = QApplication.screenAt(self.pet.frameGeometry().center()) or QApplication.primaryScreen()
-        geometry: QRect = screen.availableGeometry()
-        # 跟随速度基于分辨率。使用基准速度乘以跟随倍率。
-        # EN: Follow speed is based on resolution. Use the reference speed multiplied by the following magnification.
-        base_speed = self._base_speed_x(geometry)
-        max_step = max(1, int(round(base_speed * FOLLOW_SPEED_MULTIPLIER)))
-
-        dx = target.x() - self.pet.x()
-        dy = target.y() - self.pet.y()
+        cursor = get_movement_scheduler().cursor_pos()
+        cursor_x = cursor.x()
+        cursor_y = cursor.y()
+        pet = self.pet
+        current_x = pet.x()
+        current_y = pet.y()
+        pet_w, pet_h = self._get_pet_size()
+        idle_key = (cursor_x, cursor_y, current_x, current_y, pet_w, pet_h, self._bounds)
+        if idle_key == self._follow_idle_key:
+            return False, self._follow_idle_blocked
+
+        bounds = self._get_bounds()
+        self._get_base_speeds(bounds)
+        max_step = self._follow_max_step
+
+        # 目标为桌宠中心对准鼠标，直接用整数计算，不构造 QPoint。
+        # EN: The target centres the pet on the cursor, computed in plain ints without building a QPoint.
+        dx = cursor_x - pet_w // 2 - current_x
+        dy = cursor_y - pet_h // 2 - current_y
 
         step_x = max(-max_step, min(max_step, dx))
         step_y = max(-max_step, min(max_step, dy))
 
         if step_x == 0 and step_y == 0:
+            self._follow_idle_key = idle_key
+            self._follow_idle_blocked = False
             return False, False
 
-        current_x = self.pet.x()
-        current_y = self.pet.y()
         desired_x = current_x + step_x
         desired_y = current_y + step_y
 
-        min_x = geometry.left()
-        max_x = geometry.right() - self.pet.width()
-        min_y = geometry.top()
-        max_y = geometry.bottom() - self.pet.height()
+        min_x, max_x, min_y, max_y = self._get_limits(bounds)
 
         clamped_x = max(min_x, min(max_x, desired_x))
         clamped_y = max(min_y, min(max_y, desired_y))
@@ -156,22 +383,24 @@ class MovementController:
         blocked_by_edge = (desired_x != clamped_x) or (desired_y != clamped_y)
 
         if not moved:
+            self._follow_idle_key = idle_key
+            self._follow_idle_blocked = blocked_by_edge
             return False, blocked_by_edge
 
-        self.pet.facing_left = step_x < 0
-        self.pet._apply_state_animation()
+        # 动画由调用方 _tick 在发生位移后统一刷新，这里只更新朝向。
+        # EN: The caller's _tick refreshes the animation after any move, so only the facing is updated here.
+        pet.facing_left = step_x < 0
 
         self.pet.move(clamped_x, clamped_y)
         self._sync_float_position()
+        self._follow_idle_key = None
         return True, blocked_by_edge
 
     def auto_move_tick(self):
         """执行一次自主移动。横向与纵向独立随机执行，触边后立即反弹。"""
         """EN: Perform an autonomous move. Execute horizontally and vertically independently and randomly, and bounce immediately after touching the edge."""
-        screen = QApplication.screenAt(self.pet.frameGeometry().center()) or QApplication.primaryScreen()
-        geometry: QRect = screen.availableGeometry()
-        base_speed_x = self._base_speed_x(geometry)
-        base_speed_y = self._base_speed_y(geometry)
+        bounds = self._get_bounds()
+        base_speed_x, base_speed_y = self._get_base_speeds(bounds)
 
         self.tick_count += 1
         self._maybe_update_horizontal_velocity(base_speed_x)
@@ -179,55 +408,62 @@ class MovementController:
 
         # 避免双轴速度同时为 0 导致长时间静止。
         # EN: Avoid long stalls when both axis velocities become 0.
-        if abs(self.velocity_x) < 1e-6 and abs(self.velocity_y) < 1e-6:
-            direction = random.choice([-1, 1])
-            self.velocity_x = float(direction) * self._randomized_speed(base_speed_x)
-
-        now_ms = int(time.monotonic() * 1000)
-        # 停顿期内不移动。触边后先停顿再允许下一次位移。
-        # EN: Do not move during the standstill period. After touching the edge, pause first before allowing the next displacement.
-        if now_ms < self.pause_until_ms:
-            return
+        if self._vx_q8 == 0 and self._vy_q8 == 0:
+            self.velocity_x = random.choice(_MOVING_DIRECTIONS) * self._randomized_speed(base_speed_x)
 
-        current_x = self.pet.x()
-        current_y = self.pet.y()
+        # 停顿期内不移动。触边后先停顿再允许下一次位移。未设置停顿时不读时钟。
+        # EN: Do not move during the standstill period. After touching the edge, pause first before allowing the next displacement. The clock is only read while a pause is set.
+        if self.pause_until_ns and time.monotonic_ns() < self.pause_until_ns:
+            return
 
-        self.float_x += self.velocity_x
-        self.float_y += self.velocity_y
+        pet = self.pet
+        current_x = pet.x()
+        current_y = pet.y()
 
-        next_x = int(round(self.float_x))
-        next_y = int(round(self.float_y))
+        # 亚像素坐标累加速度，四舍五入到整像素；未触边时保留小数部分供下一 tick 继续累计。
+        # EN: Accumulate velocity into the sub-pixel coordinates and round to whole pixels; the fraction carries into the next tick unless an edge is hit.
+        fx = self._fx_q8 + self._vx_q8
+        fy = self._fy_q8 + self._vy_q8
+        next_x = (fx + _SUBPIXEL_HALF) >> _SUBPIXEL_SHIFT
+        next_y = (fy + _SUBPIXEL_HALF) >> _SUBPIXEL_SHIFT
 
-        min_x = geometry.left()
-        max_x = geometry.right() - self.pet.width()
-        min_y = geometry.top()
-        max_y = geometry.bottom() - self.pet.height()
+        min_x, max_x, min_y, max_y = self._get_limits(bounds)
 
         # 触边立即反弹：位置钳制到边界，并立刻反向速度。
         # EN: The touch immediately bounces: the position clamps to the boundary and immediately reverses the speed.
         if next_x < min_x:
             next_x = min_x
-            self.velocity_x = abs(self.velocity_x)
+            fx = min_x << _SUBPIXEL_SHIFT
+            self._vx_q8 = abs(self._vx_q8)
         elif next_x > max_x:
             next_x = max_x
-            self.velocity_x = -abs(self.velocity_x)
+            fx = max_x << _SUBPIXEL_SHIFT
+            self._vx_q8 = -abs(self._vx_q8)
 
         if next_y < min_y:
             next_y = min_y
-            self.velocity_y = abs(self.velocity_y)
+            fy = min_y << _SUBPIXEL_SHIFT
+            self._vy_q8 = abs(self._vy_q8)
         elif next_y > max_y:
             next_y = max_y
-            self.velocity_y = -abs(self.velocity_y)
+            fy = max_y << _SUBPIXEL_SHIFT
+            self._vy_q8 = -abs(self._vy_q8)
 
-        self.float_x = float(next_x)
-        self.float_y = float(next_y)
+        self._fx_q8 = fx
+        self._fy_q8 = fy
 
-        moved = (next_x != current_x) or (next_y != current_y)
+        # 位置未变（速度为 0 或不足一像素）时不调用 move，省去一次窗口重定位。
+        # EN: Skip move() when the position is unchanged (zero or sub-pixel velocity), saving a window reposition.
+        if next_x == current_x and next_y == current_y:
+            return
 
         # 只有实际发生位移时才更新朝向和动画，避免动画与位置不同步
         # EN: Only update direction and animation when actually displaced to avoid desync
-        if moved:
-            self.pet.facing_left = self.velocity_x < 0
-            self.pet._apply_state_animation()
-
-        self.pet.move(next_x, next_y)
+        # 朝向未变时动画已是正确状态（其他状态切换都会自行刷新动画），无需重复应用。
+        # EN: With the facing unchanged the animation is already correct (every other state change refreshes it itself), so it is not re-applied.
+        facing_left = self._vx_q8 < 0
+        if facing_left != pet.facing_left:
+            pet.facing_left = facing_left
+            pet._apply_state_animation()
+
+        pet.move(next_x, next_y)
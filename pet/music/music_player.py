@@ -9,7 +9,7 @@ import shutil
 import sys
 from pathlib import Path
 
-from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, QUrl, Signal
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, QUrl, Signal, Slot
 
 # Windows 下优先使用 ffmpeg 后端以支持 .ogg，并补齐 PySide6 目录到 DLL 搜索路径。
 # EN: Prefer to use the ffmpeg backend under Windows to support .ogg, and fill in the PySide6 directory to DLL search path.
@@ -41,7 +41,73 @@ MODE_ICONS = {
     PLAY_MODE_RANDOM: "🔀",
 }
 
-SUPPORTED_AUDIO_EXTENSIONS = {".ogg", ".mp3", ".wav", ".flac", ".m4a"}
+# 播放位置信号的最小转发间隔（毫秒）。进度条与秒级时间标签约 4 Hz 刷新已足够。
+# EN: Minimum interval (ms) between forwarded position signals. About 4 Hz is enough for the progress bar and the seconds label.
+POSITION_EMIT_INTERVAL_MS = 250
+
+SUPPORTED_AUDIO_EXTENSIONS = frozenset({".ogg", ".mp3", ".wav", ".flac", ".m4a"})
+
+
+def _scan_music_entries(music_dir: Path) -> list[os.DirEntry]:
+    """扫描 music/ 目录，返回受支持的音频文件条目。不访问播放器状态，可在后台线程调用。"""
+    """EN: Scan the music directory and return entries for supported audio files. Touches no player state, so it is safe on a background thread."""
+    # scandir 的 DirEntry 自带文件类型信息，先按扩展名过滤再判断 is_file，避免逐个 stat。
+    # EN: scandir's DirEntry carries the file type, and the extension is checked before is_file, so most entries need no stat.
+    # 目录缺失、无权限或条目读取失败都按空目录处理。
+    # EN: A missing or unreadable directory, or an entry that fails to read, is treated as an empty directory.
+    try:
+        with os.scandir(music_dir) as entries:
+            return [
+                entry
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in SUPPORTED_AUDIO_EXTENSIONS and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+class _PlaylistScanWorker(QObject):
+    """后台线程中的首次播放列表扫描执行器。"""
+    """EN: Initial playlist scan executor running on a background thread."""
+
+    finished = Signal(object)  # 目录条目列表
+
+    def __init__(self, music_dir: Path):
+        super().__init__()
+        self._music_dir = music_dir
+
+    @Slot()
+    def run(self):
+        # 无论扫描是否出错都要发出 finished，否则线程不会退出，播放器也会一直处于加载状态。
+        # EN: finished must be emitted even if the scan fails; otherwise the thread never quits and the player stays loading.
+        entries = []
+        try:
+            entries = _scan_music_entries(self._music_dir)
+        finally:
+            self.finished.emit(entries)
+
+
+class _TrackCopyWorker(QObject):
+    """后台线程中的歌曲复制执行器。"""
+    """EN: Track copy executor running on a background thread."""
+
+    finished = Signal(object, object, object)  # (全部目标, 成功目标, 失败信息)
+
+    def __init__(self, jobs: list[tuple[str, Path, Path]], failed_messages: list[str]):
+        super().__init__()
+        self._jobs = jobs
+        self._failed_messages = failed_messages
+
+    @Slot()
+    def run(self):
+        copied = []
+        for file_path, src, target in self._jobs:
+            try:
+                shutil.copy2(src, target)
+                copied.append(target)
+            except Exception as exc:
+                self._failed_messages.append(f"{file_path}: 复制失败：{exc}")
+        self.finished.emit([target for _, _, target in self._jobs], copied, self._failed_messages)
 
 
 class MusicPlayer(QObject):
@@ -55,6 +121,7 @@ class MusicPlayer(QObject):
     mode_changed = Signal(str)           # 播放模式
     duration_changed = Signal(object)    # 总时长（毫秒，qint64）
     position_changed = Signal(object)    # 播放位置（毫秒，qint64）
+    tracks_imported = Signal(int, object)  # 后台导入完成 (成功数, 失败信息列表)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -64,14 +131,49 @@ class MusicPlayer(QObject):
         self._player.setAudioOutput(self._audio_output)
 
         self._playlist: list[Path] = []
+        # playlist 属性返回的只读元组缓存，播放列表变化时置空。
+        # EN: Cached read-only tuple returned by the playlist property; reset whenever the playlist changes.
+        self._playlist_view: tuple[Path, ...] | None = None
         self._current_index: int = -1
         self._play_mode: str = PLAY_MODE_LIST
         self._volume: float = MUSIC_DEFAULT_VOLUME
-        self._excluded_tracks: set[Path] = set()
+        # 已移出列表但保留文件的曲目。以路径字符串为键，扫描时可直接与 DirEntry.path 比较。
+        # EN: Tracks removed from the list but kept on disk. Keyed by path string so scans compare against DirEntry.path directly.
+        self._excluded_tracks: set[str] = set()
+        # 上次与磁盘同步时的目录指纹（文件名、修改时间、大小）。内存列表被编辑后置为 None，强制下次完整比较。
+        # EN: Directory fingerprint (name, mtime, size) from the last disk sync. Reset to None after in-memory edits to force a full comparison next time.
+        self._playlist_fingerprint: tuple | None = None
+        # 曲目路径到 QUrl 的缓存，重复播放同一曲目时不再解析 URL。
+        # EN: Track path to QUrl cache, so replaying a track does not parse the URL again.
+        self._track_urls: dict[Path, QUrl] = {}
+        # 当前曲目的 (路径, 名称) 缓存。按对象身份比较，重命名会替换路径对象，缓存随之失效。
+        # EN: (path, name) cache for the current track. Compared by identity; renaming replaces the path object, which invalidates it.
+        self._current_track_name_cache: tuple[Path | None, str] = (None, "")
+        # 随机播放的洗牌队列（Fisher-Yates 一次打乱，逐个弹出）。播放列表变化时清空重建。
+        # EN: Shuffle queue for random mode (shuffled once with Fisher-Yates, then popped one by one). Cleared whenever the playlist changes.
+        self._shuffle_queue: list[int] = []
+        self._last_position_emit_ms: int = -POSITION_EMIT_INTERVAL_MS
+        # 后台任务：进行中的 (线程, 执行器)，以及导入时尚未复制完成的目标路径。
+        # EN: Background jobs: running (thread, worker) pairs, and import target paths whose copy has not finished.
+        self._background_jobs: list[tuple[QThread, QObject]] = []
+        self._pending_import_targets: set[Path] = set()
+        # 首次扫描在后台进行。扫描期间的播放请求先记下，扫描完成后再执行。
+        # EN: The initial scan runs in the background. Play requests made meanwhile are recorded and run once it finishes.
+        self._playlist_loading = False
+        self._play_queued = False
+        self._queued_play_index: int | None = None
 
         self._music_dir = Path(MUSIC_DIR)
         self._music_dir.mkdir(parents=True, exist_ok=True)
 
+        # 播放模式到“下一首”处理函数的分派表。
+        # EN: Dispatch table from play mode to its "next track" handler.
+        self._advance_handlers = {
+            PLAY_MODE_LIST: self._advance_list,
+            PLAY_MODE_SINGLE: self._advance_single,
+            PLAY_MODE_RANDOM: self._advance_random,
+        }
+
         self._watcher = QFileSystemWatcher(self)
         self._playlist_sync_timer = QTimer(self)
         self._playlist_sync_timer.setSingleShot(True)
@@ -98,37 +200,103 @@ class MusicPlayer(QObject):
     # ------------------------------------------------------------------
 
     def _load_playlist(self):
-        """扫描 music/ 目录，加载所有 OGG 文件。"""
-        """EN: Scan music/directory to load all OGG files."""
-        self._playlist = self._scan_music_dir()
+        """在后台线程扫描 music/ 目录，完成后由 _on_playlist_loaded 填充播放列表。"""
+        """EN: Scan the music directory on a background thread; _on_playlist_loaded fills the playlist when done."""
+        self._playlist_loading = True
+
+        thread = QThread(self)
+        worker = _PlaylistScanWorker(self._music_dir)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_playlist_loaded)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_background_thread_finished)
+
+        self._background_jobs.append((thread, worker))
+        thread.start()
+
+    @Slot(object)
+    def _on_playlist_loaded(self, entries: list[os.DirEntry]):
+        """首次扫描完成：填充播放列表、登记监听路径，并执行加载期间排队的播放请求。"""
+        """EN: Initial scan finished: fill the playlist, register watcher paths, and run any play request queued while loading."""
+        # 播放器已释放时丢弃结果。
+        # EN: Drop the result if the player has been disposed.
+        if not self._playlist_loading:
+            return
+        self._playlist_loading = False
+        self._playlist = self._playlist_from_entries(entries)
+        self._playlist_view = None
+        self._playlist_fingerprint = self._fingerprint_entries(entries)
+        self._shuffle_queue.clear()
         if self._playlist:
             self._current_index = 0
+        self._refresh_watcher_paths()
+        self.playlist_reordered.emit()
+        if self._playlist:
+            self.track_changed.emit(self._current_index)
 
-    def _scan_music_dir(self) -> list[Path]:
-        """扫描 music/ 目录并返回可见音频文件。"""
-        """EN: Scan the music directory and return visible audio files."""
-        if not self._music_dir.exists():
-            return []
-        files = [
-            path
-            for path in sorted(self._music_dir.iterdir())
-            if path.is_file() and path.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS and path not in self._excluded_tracks
-        ]
-        return files
+        if self._play_queued:
+            self._play_queued = False
+            self.play(self._queued_play_index)
+
+    @staticmethod
+    def _fingerprint_entries(entries: list[os.DirEntry]) -> tuple:
+        """生成目录指纹。Windows 下 DirEntry.stat 直接取自目录枚举结果，无需额外系统调用。"""
+        """EN: Build the directory fingerprint. On Windows DirEntry.stat comes from the directory listing itself, with no extra syscall."""
+        fingerprint = []
+        for entry in entries:
+            # 扫描后被删除或无法读取的文件记为占位值，下次同步会重新比较。
+            # EN: Files deleted or unreadable since the scan get placeholder values, so the next sync compares again.
+            try:
+                stat = entry.stat()
+            except OSError:
+                fingerprint.append((entry.name, -1, -1))
+                continue
+            fingerprint.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        fingerprint.sort()
+        return tuple(fingerprint)
+
+    def _playlist_from_entries(self, entries: list[os.DirEntry]) -> list[Path]:
+        """由目录条目生成排序后的可见播放列表。"""
+        """EN: Build the sorted visible playlist from directory entries."""
+        # 后台复制中的文件尚不完整，待复制完成后再由 _register_imported_track 加入。
+        # EN: Files still being copied in the background are incomplete; _register_imported_track adds them once done.
+        excluded = self._excluded_tracks
+        pending = self._pending_import_targets
+        playlist = (Path(entry.path) for entry in entries if entry.path not in excluded)
+        return sorted(path for path in playlist if path not in pending)
+
+    def _track_url(self, path: Path) -> QUrl:
+        """返回曲目的本地文件 QUrl。"""
+        """EN: Return the local-file QUrl of a track."""
+        url = self._track_urls.get(path)
+        if url is None:
+            url = QUrl.fromLocalFile(str(path))
+            self._track_urls[path] = url
+        return url
 
     def _refresh_watcher_paths(self):
         """刷新文件系统监听路径，确保目录与歌曲文件变更可被捕获。"""
         """EN: Refresh filesystem watcher paths to capture directory and track file changes."""
-        existing = self._watcher.files() + self._watcher.directories()
-        if existing:
-            self._watcher.removePaths(existing)
-
-        if self._music_dir.exists():
-            self._watcher.addPath(str(self._music_dir))
-
-        file_paths = [str(path) for path in self._playlist if path.exists()]
-        if file_paths:
-            self._watcher.addPaths(file_paths)
+        # 只增删差异部分。以监听器自身的列表为准：被删除或改名的文件会被 Qt 自动移出监听。
+        # EN: Only the difference is added or removed. The watcher's own list is authoritative, since Qt drops files that are deleted or renamed.
+        music_dir_text = str(self._music_dir)
+        if music_dir_text not in self._watcher.directories() and self._music_dir.exists():
+            self._watcher.addPath(music_dir_text)
+
+        watched = set(self._watcher.files())
+        wanted = {str(path) for path in self._playlist}
+        stale = watched - wanted
+        if stale:
+            self._watcher.removePaths(list(stale))
+        # 播放列表来自刚完成的扫描或刚完成的文件操作，新增路径无需再逐个 stat。
+        # EN: The playlist comes from a fresh scan or a just-finished file operation, so new paths need no per-file stat.
+        added = wanted - watched
+        if added:
+            self._watcher.addPaths(list(added))
 
     def _schedule_playlist_sync(self, *_):
         """对目录变化做防抖处理，避免频繁重扫。"""
@@ -138,7 +306,20 @@ class MusicPlayer(QObject):
     def _sync_playlist_from_disk(self):
         """将内存播放列表与 music/ 目录同步。"""
         """EN: Synchronize in-memory playlist with files in the music directory."""
-        self._excluded_tracks = {path for path in self._excluded_tracks if path.exists()}
+        # 首次扫描尚未完成时推迟同步，由扫描结果统一填充列表。
+        # EN: Defer syncing until the initial scan finishes; its result fills the list.
+        if self._playlist_loading:
+            self._playlist_sync_timer.start()
+            return
+        self._excluded_tracks = {path for path in self._excluded_tracks if os.path.exists(path)}
+        entries = _scan_music_entries(self._music_dir)
+        fingerprint = self._fingerprint_entries(entries)
+
+        # 目录内容与上次同步时一致、内存列表也未被编辑时，跳过路径构造与列表比较。
+        # EN: When the directory matches the last sync and the in-memory list has not been edited, skip building paths and comparing lists.
+        if fingerprint == self._playlist_fingerprint:
+            return
+        self._playlist_fingerprint = fingerprint
 
         current_path = None
         if 0 <= self._current_index < len(self._playlist):
@@ -147,9 +328,14 @@ class MusicPlayer(QObject):
         was_playing = self.is_playing
         was_paused = self.is_paused
         old_playlist = list(self._playlist)
-        new_playlist = self._scan_music_dir()
+        new_playlist = self._playlist_from_entries(entries)
 
         self._playlist = new_playlist
+        self._playlist_view = None
+        self._shuffle_queue.clear()
+        if self._track_urls:
+            kept = set(new_playlist)
+            self._track_urls = {path: url for path, url in self._track_urls.items() if path in kept}
         self._refresh_watcher_paths()
 
         if old_playlist == new_playlist:
@@ -190,8 +376,18 @@ class MusicPlayer(QObject):
     # ------------------------------------------------------------------
 
     @property
-    def playlist(self) -> list[Path]:
-        return list(self._playlist)
+    def playlist(self) -> tuple[Path, ...]:
+        view = self._playlist_view
+        if view is None:
+            view = self._playlist_view = tuple(self._playlist)
+        return view
+
+    @property
+    def track_count(self) -> int:
+        return len(self._playlist)
+
+    def track_at(self, index: int) -> Path:
+        return self._playlist[index]
 
     @property
     def current_index(self) -> int:
@@ -216,7 +412,12 @@ class MusicPlayer(QObject):
     @property
     def current_track_name(self) -> str:
         if 0 <= self._current_index < len(self._playlist):
-            return self._playlist[self._current_index].stem
+            path = self._playlist[self._current_index]
+            cached_path, name = self._current_track_name_cache
+            if path is not cached_path:
+                name = path.stem
+                self._current_track_name_cache = (path, name)
+            return name
         return "（无歌曲）"
 
     @property
@@ -236,13 +437,24 @@ class MusicPlayer(QObject):
         """播放指定索引（或当前索引）的歌曲。"""
         """EN: Plays the song for the specified index (or current index)."""
         if not self._playlist:
+            if self._playlist_loading:
+                self._play_queued = True
+                self._queued_play_index = index
             return
         if index is not None:
             self._current_index = max(0, min(index, len(self._playlist) - 1))
         if self._current_index < 0:
             self._current_index = 0
-        path = self._playlist[self._current_index]
-        self._player.setSource(QUrl.fromLocalFile(str(path)))
+        url = self._track_url(self._playlist[self._current_index])
+        # 重播已加载的同一首歌时只回到开头，避免重新打开文件与解复用。加载失败的媒体仍重新设置以便重试。
+        # EN: Replaying the track that is already loaded only rewinds it, avoiding reopening and re-demuxing the file. Media that failed to load is still set again so it is retried.
+        if (
+            self._player.source() == url
+            and self._player.mediaStatus() != QMediaPlayer.MediaStatus.InvalidMedia
+        ):
+            self._player.setPosition(0)
+        else:
+            self._player.setSource(url)
         self._player.play()
         self.track_changed.emit(self._current_index)
 
@@ -261,21 +473,46 @@ class MusicPlayer(QObject):
         """切换到下一首（按播放模式决定跳转逻辑）。"""
         """EN: Switches to the next track (decides the jump logic according to the playback mode)."""
         if not self._playlist:
+            if self._playlist_loading:
+                self.play()
             return
-        n = len(self._playlist)
-        if self._play_mode == PLAY_MODE_SINGLE:
-            self._player.setPosition(0)
-            self._player.play()
-        elif self._play_mode == PLAY_MODE_RANDOM:
-            idx = random.randint(0, n - 1)
-            self.play(idx)
-        else:
-            self.play((self._current_index + 1) % n)
+        self._advance_handlers[self._play_mode]()
+
+    def _advance_list(self):
+        """列表循环：播放下一首，末尾回到第一首。"""
+        """EN: List loop: play the next track, wrapping to the first."""
+        self.play((self._current_index + 1) % len(self._playlist))
+
+    def _advance_single(self):
+        """单曲循环：从头重播当前歌曲。"""
+        """EN: Single loop: replay the current track from the start."""
+        self._player.setPosition(0)
+        self._player.play()
+
+    def _advance_random(self):
+        """随机播放：随机选一首播放。"""
+        """EN: Shuffle: play a randomly chosen track."""
+        self.play(self._next_random_index())
+
+    def _next_random_index(self) -> int:
+        """从洗牌队列取下一首索引。队列用尽时重新打乱，一轮内每首歌只出现一次。"""
+        """EN: Take the next index from the shuffle queue. Reshuffled when exhausted, so each track plays once per round."""
+        if not self._shuffle_queue:
+            indexes = list(range(len(self._playlist)))
+            random.shuffle(indexes)
+            # 新一轮的第一首避开正在播放的歌曲。
+            # EN: The first track of a new round avoids the one currently playing.
+            if len(indexes) > 1 and indexes[-1] == self._current_index:
+                indexes[0], indexes[-1] = indexes[-1], indexes[0]
+            self._shuffle_queue = indexes
+        return self._shuffle_queue.pop()
 
     def prev(self):
         """切换到上一首。"""
         """EN: Switch to the previous one."""
         if not self._playlist:
+            if self._playlist_loading:
+                self.play()
             return
         n = len(self._playlist)
         # 若已播放 3 秒以上，先回到开头
@@ -299,6 +536,8 @@ class MusicPlayer(QObject):
         """设置应用级音量（0.0~1.0），不影响系统音量。"""
         """EN: Set the app-level volume (0.0~1.0) without affecting the system volume."""
         v = max(0.0, min(1.0, float(volume)))
+        if v == self._volume:
+            return
         self._volume = v
         self._audio_output.setVolume(v)
         self.volume_changed.emit(v)
@@ -335,6 +574,9 @@ class MusicPlayer(QObject):
             return
         track = self._playlist.pop(from_index)
         self._playlist.insert(to_index, track)
+        self._playlist_view = None
+        self._playlist_fingerprint = None
+        self._shuffle_queue.clear()
         # 更新当前播放索引
         # EN: Update Current Playback Index
         if self._current_index == from_index:
@@ -345,48 +587,99 @@ class MusicPlayer(QObject):
             self._current_index += 1
         self.playlist_reordered.emit()
 
-    def add_track_from_file(self, file_path: str):
-        """将本地音频文件拷贝到 music/ 目录并加入播放列表。返回 (ok, message)。"""
-        """EN: Copy the local audio file to the music/directory and add it to the playlist. Returns (ok, message)."""
+    def _prepare_import(self, file_path: str):
+        """校验待导入文件并在 music/ 目录选定不冲突的目标路径。返回 (src, target, error)。"""
+        """EN: Validate a file to import and pick a non-colliding target path in the music directory. Returns (src, target, error)."""
         try:
             src = Path(file_path).expanduser().resolve()
         except Exception:
-            return False, "无效文件路径"
+            return None, None, "无效文件路径"
 
         if not src.exists() or not src.is_file():
-            return False, "文件不存在"
+            return None, None, "文件不存在"
 
-        if src.suffix.lower() not in {".ogg", ".mp3", ".wav", ".flac", ".m4a"}:
-            return False, "不支持的音频格式"
+        if src.suffix.lower() not in SUPPORTED_AUDIO_EXTENSIONS:
+            return None, None, "不支持的音频格式"
 
         music_dir = Path(MUSIC_DIR)
         music_dir.mkdir(parents=True, exist_ok=True)
 
+        # 后台复制尚未完成的目标同样视为已占用。
+        # EN: Targets of background copies that have not finished yet count as taken too.
+        pending = self._pending_import_targets
         target = music_dir / src.name
-        if target.exists():
+        if target.exists() or target in pending:
             stem = src.stem
             suffix = src.suffix
             i = 1
             while True:
                 candidate = music_dir / f"{stem} ({i}){suffix}"
-                if not candidate.exists():
+                if not candidate.exists() and candidate not in pending:
                     target = candidate
                     break
                 i += 1
+        return src, target, ""
+
+    def _register_imported_track(self, target: Path):
+        """把已复制到 music/ 目录的歌曲加入播放列表。目录监听可能已先行收录，此时不重复加入。"""
+        """EN: Add a track already copied into the music directory to the playlist. The directory watcher may have picked it up first, in which case it is not added twice."""
+        self._excluded_tracks.discard(str(target))
+        if target not in self._playlist:
+            self._playlist.append(target)
+            self._playlist_view = None
+        self._playlist_fingerprint = None
+        self._shuffle_queue.clear()
+        if self._current_index < 0:
+            self._current_index = 0
+
+    def add_track_from_file(self, file_path: str):
+        """将本地音频文件拷贝到 music/ 目录并加入播放列表。返回 (ok, message)。"""
+        """EN: Copy the local audio file to the music/directory and add it to the playlist. Returns (ok, message)."""
+        src, target, error = self._prepare_import(file_path)
+        if error:
+            return False, error
 
         try:
             shutil.copy2(src, target)
         except Exception as exc:
             return False, f"复制失败：{exc}"
 
-        self._excluded_tracks.discard(target)
-        self._playlist.append(target)
-        if self._current_index < 0:
-            self._current_index = 0
+        self._register_imported_track(target)
         self._refresh_watcher_paths()
         self.playlist_reordered.emit()
         return True, str(target)
 
+    def import_tracks_async(self, file_paths: list[str]):
+        """在后台线程把多个本地音频文件拷贝到 music/ 目录。完成后加入播放列表并发出 tracks_imported。"""
+        """EN: Copy several local audio files into the music directory on a background thread. On completion they join the playlist and tracks_imported is emitted."""
+        jobs = []
+        failed_messages = []
+        for file_path in file_paths:
+            src, target, error = self._prepare_import(file_path)
+            if error:
+                failed_messages.append(f"{file_path}: {error}")
+                continue
+            self._pending_import_targets.add(target)
+            jobs.append((file_path, src, target))
+
+        if not jobs:
+            self.tracks_imported.emit(0, failed_messages)
+            return
+
+        thread = QThread(self)
+        worker = _TrackCopyWorker(jobs, failed_messages)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(self._on_tracks_copied)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_background_thread_finished)
+
+        self._background_jobs.append((thread, worker))
+        thread.start()
+
     def remove_track(self, index: int, delete_file: bool = True):
         """删除播放列表中的歌曲。delete_file=True 时同步删除 music/ 目录文件。"""
         """EN: Deletes songs from the playlist. delete_file = True Synchronously deletes the music/directory file."""
@@ -402,8 +695,12 @@ class MusicPlayer(QObject):
             self._player.stop()
 
         self._playlist.pop(index)
+        self._playlist_view = None
+        self._playlist_fingerprint = None
+        self._shuffle_queue.clear()
+        self._track_urls.pop(removed_path, None)
         if not delete_file:
-            self._excluded_tracks.add(removed_path)
+            self._excluded_tracks.add(str(removed_path))
 
         if not self._playlist:
             self._current_index = -1
@@ -422,7 +719,7 @@ class MusicPlayer(QObject):
             try:
                 if removed_path.exists():
                     removed_path.unlink()
-                self._excluded_tracks.discard(removed_path)
+                self._excluded_tracks.discard(str(removed_path))
             except Exception as exc:
                 self.playlist_reordered.emit()
                 return False, f"已移出列表，但删除文件失败：{exc}"
@@ -466,15 +763,18 @@ class MusicPlayer(QObject):
         except Exception as exc:
             return False, f"重命名失败：{exc}"
 
-        if old_path in self._excluded_tracks:
-            self._excluded_tracks.discard(old_path)
-            self._excluded_tracks.add(target_path)
+        if str(old_path) in self._excluded_tracks:
+            self._excluded_tracks.discard(str(old_path))
+            self._excluded_tracks.add(str(target_path))
 
         self._playlist[index] = target_path
+        self._playlist_view = None
+        self._playlist_fingerprint = None
+        self._track_urls.pop(old_path, None)
 
         if was_current:
             try:
-                self._player.setSource(QUrl.fromLocalFile(str(target_path)))
+                self._player.setSource(self._track_url(target_path))
                 if was_playing:
                     self._player.play()
             except Exception:
@@ -537,6 +837,17 @@ class MusicPlayer(QObject):
         except Exception:
             pass
 
+        # 等待仍在运行的后台线程结束，避免线程对象在运行中被销毁。
+        # EN: Wait for background threads still running, so no thread object is destroyed while running.
+        self._playlist_loading = False
+        self._play_queued = False
+        for thread, _ in self._background_jobs:
+            try:
+                thread.wait()
+            except Exception:
+                pass
+        self._background_jobs.clear()
+
         try:
             self._player.stop()
             self._player.setSource(QUrl())
@@ -545,6 +856,9 @@ class MusicPlayer(QObject):
 
         try:
             self._playlist.clear()
+            self._playlist_view = None
+            self._track_urls.clear()
+            self._shuffle_queue.clear()
             self._current_index = -1
             self._excluded_tracks.clear()
         except Exception:
@@ -567,17 +881,25 @@ class MusicPlayer(QObject):
         """媒体状态变化时自动衔接下一首。"""
         """EN: Automatically connects to the next song when the media state changes."""
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            if self._play_mode == PLAY_MODE_SINGLE:
-                self._player.setPosition(0)
-                self._player.play()
-            elif self._play_mode == PLAY_MODE_RANDOM:
-                n = len(self._playlist)
-                if n:
-                    self.play(random.randint(0, n - 1))
-            else:
-                n = len(self._playlist)
-                if n:
-                    self.play((self._current_index + 1) % n)
+            self.next()
+
+    @Slot(object, object, object)
+    def _on_tracks_copied(self, targets: list[Path], copied: list[Path], failed_messages: list[str]):
+        """后台复制完成后登记新歌曲并通知界面。"""
+        """EN: Register the new tracks once the background copy finishes and notify the UI."""
+        self._pending_import_targets.difference_update(targets)
+        for target in copied:
+            self._register_imported_track(target)
+        if copied:
+            self._refresh_watcher_paths()
+            self.playlist_reordered.emit()
+        self.tracks_imported.emit(len(copied), failed_messages)
+
+    @Slot()
+    def _on_background_thread_finished(self):
+        """后台线程结束后释放其引用。"""
+        """EN: Drop the references to background threads that have finished."""
+        self._background_jobs = [(thread, worker) for thread, worker in self._background_jobs if not thread.isFinished()]
 
     def _on_playback_state_changed(self, state: QMediaPlayer.PlaybackState):
         mapping = {
@@ -595,4 +917,13 @@ class MusicPlayer(QObject):
     def _on_position_changed(self, position_ms):
         """转发 Qt qint64 位置信号，避免签名不匹配导致连接失败。"""
         """EN: Forward the Qt qint64 position signal to avoid the signature mismatch causing the connection to fail."""
+        # 节流：距上次转发不足间隔时丢弃；向后跳转、回到开头与播放结束时总是转发。
+        # EN: Throttled: dropped when within the interval of the last forward; backward seeks, returning to the start and reaching the end are always forwarded.
+        if (
+            0 <= position_ms - self._last_position_emit_ms < POSITION_EMIT_INTERVAL_MS
+            and position_ms != 0
+            and position_ms != self._player.duration()
+        ):
+            return
+        self._last_position_emit_ms = position_ms
         self.position_changed.emit(position_ms)
@@ -8,6 +8,13 @@ import os
 from pathlib import Path
 from typing import Any
 
+from PySide6.QtCore import QTimer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 未安装时回退标准库 json
+    orjson = None
+
 from .config import (
     APP_NAME,
     DISPLAY_MODE_ALWAYS_ON_TOP,
@@ -25,6 +32,18 @@ from .config import (
 from .i18n import normalize_language
 from .llm_providers import get_all_providers, get_provider
 
+# 设置写盘的合并延迟（毫秒）。滑块拖动等连续修改只在停止后写一次。
+# EN: Coalescing delay (ms) for settings writes. Continuous edits such as slider drags are written once they settle.
+SETTINGS_SAVE_DELAY_MS = 500
+
+# 合法显示模式集合。模块加载时构建一次，校验时不再临时创建集合。
+# EN: Valid display modes, built once at import so validation does not allocate a set per call.
+_VALID_DISPLAY_MODES = frozenset({
+    DISPLAY_MODE_ALWAYS_ON_TOP,
+    DISPLAY_MODE_FULLSCREEN_HIDE,
+    DISPLAY_MODE_DESKTOP_ONLY,
+})
+
 
 class SettingsStore:
     """应用设置存储。提供读取、更新和保存能力。"""
@@ -51,6 +70,13 @@ class SettingsStore:
         # 兼容旧位置（项目根目录）。仅用于迁移，不再作为默认写入路径。
         # EN: Legacy root path (project root), used only for migration.
         self.legacy_local_config_path = Path(ROOT_DIR) / "config_local.yaml"
+        # 延迟保存：setter 只标记脏数据并重启定时器，定时器到期后统一写盘。
+        # EN: Deferred saving: setters only mark the data dirty and restart the timer, which writes once it fires.
+        self._dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
         self._load()
         self._ensure_api_key_config_files()
         self._migrate_api_keys_to_local_config()
@@ -82,12 +108,43 @@ class SettingsStore:
             return
 
     def save(self):
-        """将当前设置写回磁盘。"""
-        """EN: Write the current settings back to disk."""
-        self.settings_path.write_text(
-            json.dumps(self.data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        """立即将当前设置写回磁盘。先写临时文件再替换，避免中途崩溃留下残缺文件。"""
+        """EN: Write the current settings back to disk immediately. A temporary file is written and then swapped in, so a crash midway never leaves a truncated file."""
+        self._save_timer.stop()
+        tmp_path = self.settings_path.with_name(self.settings_path.name + ".tmp")
+        # 可用时用 orjson 的 C 编码器生成同样的两空格缩进输出，否则使用标准库。
+        # EN: Use orjson's C encoder for the same two-space indented output when available, otherwise the standard library.
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        else:
+            tmp_path.write_text(
+                json.dumps(self.data, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        os.replace(tmp_path, self.settings_path)
+        # 写入成功后才清除脏标记；失败时保留，退出前的 flush 会再试一次。
+        # EN: The dirty flag is cleared only after a successful write; on failure it stays set so the flush before exit retries.
+        self._dirty = False
+
+    def flush(self):
+        """写出尚未保存的修改。退出前调用，确保延迟中的设置不会丢失。"""
+        """EN: Write out pending changes. Called before exit so deferred settings are not lost."""
+        if self._dirty:
+            self.save()
+
+    def _schedule_save(self):
+        """标记设置已修改，并在合并延迟后写盘。"""
+        """EN: Mark the settings as modified and write them after the coalescing delay."""
+        self._dirty = True
+        self._save_timer.start()
+
+    def _set_value(self, key: str, value: Any):
+        """更新单个设置项。值未变化时不安排写盘。"""
+        """EN: Update a single setting. No write is scheduled when the value is unchanged."""
+        if key in self.data and self.data[key] == value:
+            return
+        self.data[key] = value
+        self._schedule_save()
 
     def _provider_ids(self) -> list[str]:
         """返回全部模型提供商ID。"""
@@ -310,32 +367,22 @@ class SettingsStore:
         """EN: Update the close behavior configuration and save."""
         if behavior not in {"ask", "quit", "tray"}:
             return
-        self.data["close_behavior"] = behavior
-        self.save()
+        self._set_value("close_behavior", behavior)
 
     def get_display_mode(self) -> str:
         """读取显示模式配置。返回 always_on_top、fullscreen_hide 或 desktop_only。"""
         """EN: Read the display mode configuration. Returns always_on_top, fullscreen_hide, or desktop_only."""
         value = self.data.get("display_mode", DISPLAY_MODE_ALWAYS_ON_TOP)
-        if value in {
-            DISPLAY_MODE_ALWAYS_ON_TOP,
-            DISPLAY_MODE_FULLSCREEN_HIDE,
-            DISPLAY_MODE_DESKTOP_ONLY,
-        }:
+        if value in _VALID_DISPLAY_MODES:
             return value
         return DISPLAY_MODE_ALWAYS_ON_TOP
 
     def set_display_mode(self, mode: str):
         """更新显示模式配置并保存。非法值自动回退到默认模式。"""
         """EN: Update the display mode configuration and save. Illegal value automatically falls back to default mode."""
-        if mode not in {
-            DISPLAY_MODE_ALWAYS_ON_TOP,
-            DISPLAY_MODE_FULLSCREEN_HIDE,
-            DISPLAY_MODE_DESKTOP_ONLY,
-        }:
+        if mode not in _VALID_DISPLAY_MODES:
             mode = DISPLAY_MODE_ALWAYS_ON_TOP
-        self.data["display_mode"] = mode
-        self.save()
+        self._set_value("display_mode", mode)
 
     def get_instance_count(self) -> int:
         """读取实例数量配置。返回范围限制在 1~50。"""
@@ -355,8 +402,7 @@ class SettingsStore:
         except (TypeError, ValueError):
             normalized = INSTANCE_COUNT_MIN
         normalized = max(INSTANCE_COUNT_MIN, min(INSTANCE_COUNT_MAX, normalized))
-        self.data["instance_count"] = normalized
-        self.save()
+        self._set_value("instance_count", normalized)
 
     def get_opacity_percent(self) -> int:
         """读取透明度配置。返回范围限制在 0~100。"""
@@ -376,8 +422,7 @@ class SettingsStore:
         except (TypeError, ValueError):
             normalized = OPACITY_DEFAULT_PERCENT
         normalized = max(OPACITY_PERCENT_MIN, min(OPACITY_PERCENT_MAX, normalized))
-        self.data["opacity_percent"] = normalized
-        self.save()
+        self._set_value("opacity_percent", normalized)
 
     def get_follow_mouse(self) -> bool:
         """读取跟随鼠标配置。"""
@@ -387,8 +432,7 @@ class SettingsStore:
     def set_follow_mouse(self, enabled: bool):
         """更新跟随鼠标配置并保存。"""
         """EN: Updates follow the mouse configuration and are saved."""
-        self.data["follow_mouse"] = bool(enabled)
-        self.save()
+        self._set_value("follow_mouse", bool(enabled))
 
     def get_scale_factor(self) -> float:
         """读取缩放配置。返回范围限制在允许区间。"""
@@ -408,8 +452,7 @@ class SettingsStore:
         except (TypeError, ValueError):
             normalized = 1.0
         normalized = max(SCALE_MIN, min(SCALE_MAX, normalized))
-        self.data["scale_factor"] = normalized
-        self.save()
+        self._set_value("scale_factor", normalized)
 
     def get_language(self) -> str:
         """读取界面语言配置。"""
@@ -419,8 +462,7 @@ class SettingsStore:
     def set_language(self, language: str):
         """更新界面语言配置并保存。"""
         """EN: Update the interface language configuration and save."""
-        self.data["language"] = normalize_language(language)
-        self.save()
+        self._set_value("language", normalize_language(language))
 
     def get_api_key(self) -> str:
         """读取 DeepSeek API Key。"""
@@ -440,8 +482,7 @@ class SettingsStore:
     def set_autostart_show_window(self, enabled: bool):
         """更新开机自启时是否显示窗口的配置并保存。"""
         """EN: Update the configuration for showing window on autostart and save."""
-        self.data["autostart_show_window"] = bool(enabled)
-        self.save()
+        self._set_value("autostart_show_window", bool(enabled))
 
     # === 多模型配置存储 ===
     # EN: === Multi-model configuration storage ===
@@ -455,8 +496,7 @@ class SettingsStore:
     def set_llm_provider(self, provider_id: str):
         """设置当前模型提供商。"""
         """EN: Set the current model provider."""
-        self.data["llm_provider"] = str(provider_id)
-        self.save()
+        self._set_value("llm_provider", str(provider_id))
 
     def get_llm_model(self, provider_id: str) -> str:
         """获取特定提供商的模型，未设置返回空字符串。"""
@@ -469,8 +509,7 @@ class SettingsStore:
         """设置特定提供商的模型。"""
         """EN: Set the model for a specific provider."""
         key = f"llm_model_{provider_id}"
-        self.data[key] = str(model)
-        self.save()
+        self._set_value(key, str(model))
 
     def get_api_key_for_provider(self, provider_id: str) -> str:
         """获取特定提供商的API密钥。"""
@@ -516,7 +555,7 @@ class SettingsStore:
             self.data.pop("api_key", None)
             changed = True
         if changed:
-            self.save()
+            self._schedule_save()
 
         provider = get_provider(normalized_provider)
         if provider is not None:
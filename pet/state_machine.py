@@ -4,7 +4,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PetStateMachine:
     """这是轻量状态容器。提供统一状态切换方法。"""
     """EN: This is a lightweight status container. Provides a unified state switching method."""
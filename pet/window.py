@@ -1,10 +1,10 @@
 ﻿"""该模块是桌宠主窗口。整合动画、输入、状态机、菜单与控制器。"""
 """EN: This module implements the main desktop-pet window and integrates animation, input, state, menu, and control logic."""
-from PySide6.QtCore import QEvent, QPoint, Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, QPoint, Qt, Signal
 from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QInputDialog, QMenu, QMessageBox, QWidget
 from PySide6.QtCore import QFile
-from PySide6.QtCore import QEvent, QPoint, Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, QPoint, Qt, Signal
 from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QInputDialog, QMenu, QMessageBox, QWidget
 from PySide6.QtCore import QFile
@@ -16,14 +16,13 @@ from .config import (
     DISPLAY_MODE_ALWAYS_ON_TOP,
     INSTANCE_COUNT_MAX,
     INSTANCE_COUNT_MIN,
-    MOVE_TICK_MS,
     OPACITY_DEFAULT_PERCENT,
     OPACITY_PERCENT_MAX,
     OPACITY_PERCENT_MIN,
 )
 from .idle import IdleController
 from .input import handle_mouse_move, handle_mouse_press, handle_mouse_release
-from .menu import build_context_menu, sync_context_menu_state
+from .menu import get_or_build_context_menu
 from .movement import MovementController
 from .state_machine import PetStateMachine
 from .i18n import normalize_language, tr
@@ -104,6 +103,9 @@ class DesktopPet(QWidget):
         self._menu_open: bool = False
         self._always_on_top = True
         self._force_topmost_for_multi = False
+        # 修改窗口标志时 Qt 会先隐藏窗口，此期间的隐藏事件不属于实例自行隐藏。
+        # EN: Qt hides the window while its flags change; hide events during that are not the pet hiding itself.
+        self._updating_window_flags = False
         self.language = "zh-CN"
 
         self.movement = MovementController(self)
@@ -113,9 +115,9 @@ class DesktopPet(QWidget):
         # EN: Enter the mobile animation by default. The initial orientation is set to right.
         self._set_animation("move", mirror=False)
 
-        self.tick_timer = QTimer(self)
-        self.tick_timer.timeout.connect(self._tick)
-        self.tick_timer.start(MOVE_TICK_MS)
+        # 主循环由全体桌宠共用的移动节拍驱动。
+        # EN: The main loop is driven by the movement clock shared by all pets.
+        self.movement.start_ticking()
 
         self.idle.start()
         self.movement.place_initial()
@@ -188,11 +190,11 @@ class DesktopPet(QWidget):
 
         self._set_animation("move", mirror=self.facing_left)
 
-    def _tick(self):
-        """执行主循环调度。按拖拽>跟随>休息>自主移动优先级处理。"""
-        """EN: Perform the main loop scheduling. Press Drag > Follow > Rest > Autonomous Move Priority Processing."""
+    def _tick(self) -> bool:
+        """执行主循环调度。按拖拽>跟随>休息>自主移动优先级处理。返回是否仍需后续节拍。"""
+        """EN: Perform the main loop scheduling. Press Drag > Follow > Rest > Autonomous Move Priority Processing. Returns whether further ticks are needed."""
         if self.state.is_dragging:
-            return
+            return False
 
         if self.state.follow_mouse:
             moved, blocked_by_edge = self.movement.follow_cursor_tick()
@@ -204,13 +206,15 @@ class DesktopPet(QWidget):
                 if self.follow_blocked:
                     self.follow_blocked = False
                 self._apply_state_animation()
-            return
+            return True
 
         if self.state.in_rest:
-            return
+            return False
 
         if self.state.move_enabled:
             self.movement.auto_move_tick()
+            return True
+        return False
 
     def apply_stop_move(self):
         """本地执行停止移动。仅操作当前实例，不做跨实例传播。"""
@@ -242,6 +246,7 @@ class DesktopPet(QWidget):
         self.follow_blocked = False
         self.move_enabled_changed.emit(self.state.move_enabled)
         self._apply_state_animation()
+        self.movement.wake_ticking()
 
     def apply_move_enabled(self, enabled: bool):
         """本地应用移动开关。"""
@@ -283,6 +288,7 @@ class DesktopPet(QWidget):
         if before_move_enabled != bool(self.state.move_enabled):
             self.move_enabled_changed.emit(self.state.move_enabled)
         self._apply_state_animation()
+        self.movement.wake_ticking()
 
     def on_toggle_follow(self, checked=False):
         """处理跟随鼠标开关事件。优先委托实例管理器。"""
@@ -349,8 +355,8 @@ class DesktopPet(QWidget):
         """EN: Ready to quit. Stop the timer and close the active menu."""
         self._is_exiting = True
 
-        if self.tick_timer.isActive():
-            self.tick_timer.stop()
+        if self.movement.is_ticking():
+            self.movement.stop_ticking()
 
         if self.idle.rest_decision_timer.isActive():
             self.idle.rest_decision_timer.stop()
@@ -364,14 +370,7 @@ class DesktopPet(QWidget):
                 self.active_menu.deleteLater()
             self.active_menu = None
 
-        if self._context_menu is not None:
-            try:
-                self._context_menu.aboutToHide.disconnect(self._on_menu_hide)
-            except Exception:
-                pass
-            self._context_menu.close()
-            self._context_menu.deleteLater()
-            self._context_menu = None
+        self._release_context_menu()
 
         if hasattr(self, "label") and hasattr(self.label, "clear_movie"):
             self.label.clear_movie()
@@ -390,6 +389,43 @@ class DesktopPet(QWidget):
         self.movies.clear()
         self.rest_movies.clear()
 
+    def reset_for_pool(self):
+        """回收到实例池。停止计时器与动画、关闭菜单并隐藏，保留动画资源以便复用。"""
+        """EN: Recycle into the instance pool. Stop timers and animations, close the menu and hide, keeping animation resources for reuse."""
+        if self.movement.is_ticking():
+            self.movement.stop_ticking()
+
+        if self.idle.rest_decision_timer.isActive():
+            self.idle.rest_decision_timer.stop()
+
+        if self.idle.rest_end_timer.isActive():
+            self.idle.rest_end_timer.stop()
+
+        if self.active_menu is not None:
+            self.active_menu.close()
+            if self.active_menu is not self._context_menu:
+                self.active_menu.deleteLater()
+            self.active_menu = None
+
+        # 停止全部 GIF 解码。解绑当前动画后，恢复时 set_movie 会重新启动所需的那一个。
+        # EN: Stop all GIF decoding. With the current movie detached, set_movie restarts the needed one on resume.
+        self.label.clear_movie()
+        for movie in list(self.movies.values()) + list(self.rest_movies):
+            movie.stop()
+
+        self.state.end_drag()
+        self.state.exit_rest()
+        self.follow_blocked = False
+        self.hide()
+
+    def resume_from_pool(self):
+        """从实例池取出后恢复运行。重启计时器与动画并重新放置；是否显示由实例管理器按显示策略决定。"""
+        """EN: Resume after being taken from the instance pool. Restart timers and animation and re-place it; the instance manager decides visibility from the display policy."""
+        self._apply_state_animation()
+        self.movement.start_ticking()
+        self.idle.start()
+        self.movement.place_initial()
+
     def apply_autostart(self, enabled: bool):
         """本地应用开机自启设置。"""
         """EN: Local app bootup autostart settings."""
@@ -486,7 +522,11 @@ class DesktopPet(QWidget):
         """EN: App final sticky status: The user sets the OR to temporarily sticky."""
         should_topmost = self._always_on_top or self._force_topmost_for_multi
         was_visible = self.isVisible()
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, should_topmost)
+        self._updating_window_flags = True
+        try:
+            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, should_topmost)
+        finally:
+            self._updating_window_flags = False
         if was_visible:
             self.show()
             if should_topmost:
@@ -520,14 +560,7 @@ class DesktopPet(QWidget):
         """EN: Local app interface language and refresh the context menu cache."""
         self.language = normalize_language(language)
         self.language_changed.emit(self.language)
-        if self._context_menu is not None:
-            try:
-                self._context_menu.aboutToHide.disconnect(self._on_menu_hide)
-            except Exception:
-                pass
-            self._context_menu.close()
-            self._context_menu.deleteLater()
-            self._context_menu = None
+        self._release_context_menu()
 
     def on_set_language(self, language: str):
         """设置语言。优先委托实例管理器。"""
@@ -621,17 +654,35 @@ class DesktopPet(QWidget):
     def build_menu(self):
         """创建右键菜单。菜单项由独立模块构建。"""
         """EN: Creates a context menu. Menu items are built by separate modules."""
-        if self._context_menu is None:
-            self._context_menu = build_context_menu(
-                self,
-                self.music_player,
-                language=self.get_language(),
-                on_set_language=self.on_set_language,
-            )
+        menu = get_or_build_context_menu(
+            self,
+            self.music_player,
+            language=self.get_language(),
+            on_set_language=self.on_set_language,
+        )
+        if menu is not self._context_menu:
+            self._release_context_menu()
+            self._context_menu = menu
             self._context_menu.aboutToHide.connect(self._on_menu_hide)
-        sync_context_menu_state(self._context_menu, self, self.music_player, language=self.get_language())
         return self._context_menu
 
+    def _release_context_menu(self):
+        """释放缓存的右键菜单。"""
+        """EN: Release the cached context menu."""
+        if self._context_menu is None:
+            return
+        try:
+            self._context_menu.aboutToHide.disconnect(self._on_menu_hide)
+        except Exception:
+            pass
+        # 子菜单、动作组与动作都以该菜单为父对象，随菜单一起释放。
+        # EN: Submenus, action groups and actions are all parented to this menu and are released with it.
+        self._context_menu.close()
+        self._context_menu.deleteLater()
+        if self.active_menu is self._context_menu:
+            self.active_menu = None
+        self._context_menu = None
+
     def show_context_menu(self, global_pos):
         """在鼠标处弹出菜单。菜单位置固定，弹出实例显示描边。"""
         """EN: A menu pops up at the mouse. The menu position is fixed, and the pop-up instance shows the stroke."""
@@ -663,6 +714,19 @@ class DesktopPet(QWidget):
         """EN: Handles window movement events."""
         super().moveEvent(event)
 
+    def resizeEvent(self, event):
+        """处理窗口尺寸变化事件。通知移动控制器刷新尺寸缓存。"""
+        """EN: Handles window resize events. Tells the movement controller to refresh its size cache."""
+        super().resizeEvent(event)
+        self.movement.invalidate_pet_size()
+
+    def hideEvent(self, event):
+        """处理隐藏事件。实例自行隐藏（如关闭到托盘）时通知实例管理器，由显示策略决定是否重新显示。"""
+        """EN: Handles hide events. When the pet hides itself (e.g. closing to the tray) the instance manager is told, so the display policy decides whether to show it again."""
+        super().hideEvent(event)
+        if self.instance_manager is not None and not event.spontaneous() and not self._updating_window_flags:
+            self.instance_manager.notify_pet_hidden(self)
+
     def paintEvent(self, event):
         """绘制窗口。菜单开启时在边缘绘制天蓝色描边。"""
         """EN: Draws a window. Draws sky blue strokes on the edges when the menu opens."""